@@ -5,7 +5,7 @@ Compares two blueprints and provides detailed difference analysis.
 
 import logging
 from typing import Dict, Any, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,13 @@ class ChangeType(Enum):
     MODIFIED = "modified"
     UNCHANGED = "unchanged"
 
+# Prefix for each change line in the human-readable diff
+_CHANGE_SYMBOLS = {
+    ChangeType.ADDED: "+",
+    ChangeType.REMOVED: "-",
+    ChangeType.MODIFIED: "~"
+}
+
 @dataclass
 class Change:
     """Represents a single change in blueprint diff."""
@@ -33,6 +40,16 @@ class DiffResult:
     summary: Dict[str, int]
     is_identical: bool
     total_changes: int
+    # Indexes over `changes`, built once: by full path and by top-level section (e.g. "connections")
+    changes_by_path: Dict[str, List[Change]] = field(init=False, repr=False, compare=False)
+    changes_by_prefix: Dict[str, List[Change]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.changes_by_path = {}
+        self.changes_by_prefix = {}
+        for change in self.changes:
+            self.changes_by_path.setdefault(change.path, []).append(change)
+            self.changes_by_prefix.setdefault(change.path.split(".", 1)[0], []).append(change)
 
 class BlueprintDiff:
     """Provides blueprint comparison and diff functionality."""
@@ -51,6 +68,15 @@ class BlueprintDiff:
         Returns:
             DiffResult containing all detected changes
         """
+        # The same object can't differ from itself
+        if blueprint1 is blueprint2:
+            return DiffResult(
+                changes=[],
+                summary={"total": 0, "added": 0, "removed": 0, "modified": 0},
+                is_identical=True,
+                total_changes=0
+            )
+
         changes = []
 
         # Compare top-level properties
@@ -134,7 +160,7 @@ class BlueprintDiff:
         modules1_by_id = {mod.get("id"): mod for mod in modules1}
         modules2_by_id = {mod.get("id"): mod for mod in modules2}
 
-        all_module_ids = set(modules1_by_id.keys()) | set(modules2_by_id.keys())
+        all_module_ids = modules1_by_id.keys() | modules2_by_id.keys()
 
         for module_id in all_module_ids:
             mod1 = modules1_by_id.get(module_id)
@@ -207,7 +233,7 @@ class BlueprintDiff:
     def _compare_params(self, module_id: str, params1: Dict, params2: Dict) -> List[Change]:
         """Compare module parameters."""
         changes = []
-        all_param_keys = set(params1.keys()) | set(params2.keys())
+        all_param_keys = params1.keys() | params2.keys()
 
         for param_key in all_param_keys:
             old_val = params1.get(param_key)
@@ -297,7 +323,7 @@ class BlueprintDiff:
     def _compare_policies(self, policies1: Dict, policies2: Dict) -> List[Change]:
         """Compare blueprint policies."""
         changes = []
-        all_policy_keys = set(policies1.keys()) | set(policies2.keys())
+        all_policy_keys = policies1.keys() | policies2.keys()
 
         for policy_key in all_policy_keys:
             old_val = policies1.get(policy_key)
@@ -369,11 +395,12 @@ class BlueprintDiff:
         }
 
         for change in changes:
-            if change.change_type == ChangeType.ADDED:
+            change_type = change.change_type
+            if change_type is ChangeType.ADDED:
                 summary["added"] += 1
-            elif change.change_type == ChangeType.REMOVED:
+            elif change_type is ChangeType.REMOVED:
                 summary["removed"] += 1
-            elif change.change_type == ChangeType.MODIFIED:
+            elif change_type is ChangeType.MODIFIED:
                 summary["modified"] += 1
 
         return summary
@@ -393,14 +420,10 @@ class BlueprintDiff:
             "Changes:"
         ]
 
-        for change in diff_result.changes:
-            symbol = {
-                ChangeType.ADDED: "+",
-                ChangeType.REMOVED: "-",
-                ChangeType.MODIFIED: "~"
-            }.get(change.change_type, "?")
-
-            lines.append(f"  {symbol} {change.description}")
+        lines.extend(
+            f"  {_CHANGE_SYMBOLS.get(change.change_type, '?')} {change.description}"
+            for change in diff_result.changes
+        )
 
         return "\n".join(lines)
 
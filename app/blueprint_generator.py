@@ -2,15 +2,31 @@
 Blueprint Generator using OpenAI GPT for OttoMate API.
 """
 
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, Any, Tuple, Optional
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, Tuple, Optional
+import orjson
 from app.lint_runner import lint
-from app.config import get_openai_api_key, MOCK_BLUEPRINT_VERSION, MOCK_GMAIL_APP, MOCK_SLACK_APP, MOCK_SLACK_CHANNEL
+from app.config import (
+    get_openai_api_key, get_blueprint_cache_enabled, get_llm_timeout, MOCK_BLUEPRINT_VERSION,
+    MOCK_GMAIL_APP, MOCK_SLACK_APP, MOCK_SLACK_CHANNEL, OPENAI_MODEL, OPENAI_TEMPERATURE,
+    OPENAI_MAX_TOKENS, LLM_MAX_RETRIES, LLM_PREWARM_TIMEOUT_SECONDS, LLM_CONNECT_TIMEOUT_SECONDS,
+    LLM_KEEPALIVE_CONNECTIONS, LLM_KEEPALIVE_EXPIRY_SECONDS, BLUEPRINT_CACHE_DIR,
+    BLUEPRINT_CACHE_TTL_SECONDS, BLUEPRINT_CACHE_MAX_ENTRIES, BATCH_COMPLETION_WINDOW,
+    BATCH_POLL_INTERVAL_SECONDS, BATCH_MAX_WAIT_SECONDS
+)
+
+# Terminal states of an OpenAI batch
+_BATCH_DONE_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 try:
     import openai
+    import httpx  # installed with openai
 except ImportError:
     openai = None
 
@@ -28,8 +44,13 @@ class BlueprintGenerator:
         try:
             api_key = get_openai_api_key()
             if api_key and openai:
-                # Initialize OpenAI client (v1.x.x format)
-                self.client = openai.OpenAI(api_key=api_key)
+                # Initialize OpenAI client (v1.x.x format); a hung request is cut off and
+                # retried instead of blocking the job forever
+                self.client = openai.OpenAI(
+                    api_key=api_key,
+                    timeout=get_llm_timeout(),
+                    max_retries=LLM_MAX_RETRIES
+                )
                 self.api_key = api_key
                 logger.info("OpenAI client initialized successfully")
             elif not openai:
@@ -47,6 +68,55 @@ class BlueprintGenerator:
         # Available if we have OpenAI client OR fallback to mock
         return self.client is not None or True  # Always available (fallback to mock)
     
+    @contextmanager
+    def pooled_client(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Route OpenAI calls through one dedicated keep-alive connection pool until exit.
+
+        Meant to wrap a run of many generations (e.g. a test suite) so they share warm
+        connections; the original client is restored and the pool closed afterwards.
+
+        Args:
+            timeout: Per-request timeout for the duration (defaults to get_llm_timeout())
+        """
+        if not (self.client and openai):
+            yield self.client
+            return
+
+        http_client = openai.DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=LLM_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+        original_client = self.client
+        self.client = original_client.with_options(
+            http_client=http_client,
+            timeout=httpx.Timeout(timeout or get_llm_timeout(), connect=LLM_CONNECT_TIMEOUT_SECONDS)
+        )
+        try:
+            yield self.client
+        finally:
+            self.client = original_client
+            http_client.close()
+
+    def prewarm(self, timeout: float = LLM_PREWARM_TIMEOUT_SECONDS) -> bool:
+        """
+        Open a connection to the OpenAI API ahead of the first generation.
+
+        The client keeps the connection in its pool, so the first real request skips
+        the TCP/TLS handshake. Failures are ignored; returns True if the API answered.
+        """
+        if not (self.client and openai):
+            return False
+
+        try:
+            self.client.with_options(timeout=timeout, max_retries=0).models.list()
+            return True
+        except Exception as e:
+            logger.info(f"OpenAI prewarm skipped: {e}")
+            return False
+
     def generate_blueprint(self, brief: str) -> Tuple[bool, Dict[str, Any]]:
         """
         Generate a Make.com blueprint from a natural language brief.
@@ -70,28 +140,155 @@ class BlueprintGenerator:
                 "violations": []
             }
 
+    def generate_blueprints_batch(self, briefs: Dict[str, str],
+                                  poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+                                  max_wait: float = BATCH_MAX_WAIT_SECONDS) -> Dict[str, Tuple[bool, Dict[str, Any]]]:
+        """
+        Generate blueprints for several briefs in one OpenAI Batch API submission.
+
+        Meant for offline runs: batches are cheaper but may take minutes to complete.
+        Falls back to generate_blueprint per brief when OpenAI is not available.
+
+        Args:
+            briefs: Mapping of caller-chosen ID to brief content
+            poll_interval: Seconds between batch status checks
+            max_wait: Seconds to wait for the batch before cancelling it and failing its briefs
+
+        Returns:
+            Mapping of the same IDs to (success: bool, result: dict)
+        """
+        if not (self.client and openai):
+            return {brief_id: self.generate_blueprint(brief) for brief_id, brief in briefs.items()}
+
+        results: Dict[str, Tuple[bool, Dict[str, Any]]] = {}
+        pending: Dict[str, Path] = {}  # brief_id -> cache file
+        lines = []
+
+        try:
+            for brief_id, brief in briefs.items():
+                request_body = self._chat_request(brief)
+                cache_file = self._cache_path(request_body)
+                cached = self._read_cache(cache_file)
+                if cached is not None:
+                    results[brief_id] = (True, cached)
+                    continue
+                pending[brief_id] = cache_file
+                lines.append(orjson.dumps({
+                    "custom_id": brief_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request_body
+                }))
+
+            if not pending:
+                return results
+
+            input_file = self.client.files.create(file=("blueprints.jsonl", b"\n".join(lines)), purpose="batch")
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+            logger.info(f"Submitted blueprint batch {batch.id} with {len(pending)} requests")
+
+            deadline = time.monotonic() + max_wait
+            while batch.status not in _BATCH_DONE_STATUSES:
+                if time.monotonic() >= deadline:
+                    self.client.batches.cancel(batch.id)
+                    raise TimeoutError(f"batch {batch.id} not finished after {max_wait}s; cancelled")
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                item = orjson.loads(line)
+                brief_id = item.get("custom_id")
+                if brief_id not in pending:
+                    continue
+
+                response = item.get("response") or {}
+                body = response.get("body") or {}
+                if item.get("error") or response.get("status_code", 200) >= 400:
+                    error = item.get("error") or body.get("error")
+                    results[brief_id] = (False, {"error": f"OpenAI batch request failed: {error}", "violations": []})
+                    continue
+
+                results[brief_id] = self._process_completion(
+                    body["choices"][0]["message"]["content"],
+                    {"generated_at": body.get("created"), "model": body.get("model"), "usage": body.get("usage")},
+                    pending[brief_id]
+                )
+
+        except Exception as e:
+            logger.error(f"OpenAI batch generation failed: {e}")
+            for brief_id in pending:
+                results.setdefault(brief_id, (False, {"error": f"OpenAI batch error: {str(e)}", "violations": []}))
+
+        for brief_id in pending:
+            results.setdefault(brief_id, (False, {"error": "No result returned for brief in batch output", "violations": []}))
+
+        return results
+
+    def _chat_request(self, brief: str) -> Dict[str, Any]:
+        """Build the chat completion request body for a brief."""
+        # Load blueprint schema for context
+        schema_context = self._get_schema_context()
+
+        # Create the prompt for OpenAI
+        prompt = self._create_blueprint_prompt(brief, schema_context)
+
+        return {
+            "model": OPENAI_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are a Make.com automation expert. Generate valid Make.com blueprints from natural language descriptions."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": OPENAI_TEMPERATURE,
+            "max_tokens": OPENAI_MAX_TOKENS
+        }
+
     def _generate_with_openai(self, brief: str) -> Tuple[bool, Dict[str, Any]]:
         """Generate blueprint using OpenAI API."""
         try:
-            # Load blueprint schema for context
-            schema_context = self._get_schema_context()
+            request_body = self._chat_request(brief)
 
-            # Create the prompt for OpenAI
-            prompt = self._create_blueprint_prompt(brief, schema_context)
+            # Identical requests reuse a previously validated generation
+            cache_file = self._cache_path(request_body)
+            cached = self._read_cache(cache_file)
+            if cached is not None:
+                logger.info(f"Using cached blueprint generation {cache_file.stem}")
+                return True, cached
 
             # Call OpenAI API (v1.x.x format)
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a Make.com automation expert. Generate valid Make.com blueprints from natural language descriptions."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
+            response = self.client.chat.completions.create(**request_body)
+
+            return self._process_completion(
+                response.choices[0].message.content,
+                {
+                    "generated_at": response.created,
+                    "model": response.model,
+                    "usage": response.usage._asdict() if hasattr(response.usage, '_asdict') else str(response.usage)
+                },
+                cache_file
             )
 
+        except Exception as e:
+            logger.error(f"OpenAI API call failed: {e}")
+            return False, {
+                "error": f"OpenAI API error: {str(e)}",
+                "violations": []
+            }
+
+    def _process_completion(self, content: str, metadata: Dict[str, Any], cache_file: Path) -> Tuple[bool, Dict[str, Any]]:
+        """Parse, validate and (once) auto-repair a completion, caching it if it passes."""
+        try:
             # Extract the blueprint JSON from response
-            blueprint_text = response.choices[0].message.content.strip()
+            blueprint_text = content.strip()
 
             # Parse JSON from response (may be wrapped in markdown)
             blueprint = self._extract_json_from_response(blueprint_text)
@@ -112,12 +309,9 @@ class BlueprintGenerator:
                         lint_result = repair_lint_result
 
             if lint_result["ok"]:
-                return True, {
-                    "blueprint": blueprint,
-                    "generated_at": response.created,
-                    "model": response.model,
-                    "usage": response.usage._asdict() if hasattr(response.usage, '_asdict') else str(response.usage)
-                }
+                result = {"blueprint": blueprint, **metadata}
+                self._write_cache(cache_file, result)
+                return True, result
             else:
                 return False, {
                     "error": "Generated blueprint failed validation after auto-repair",
@@ -131,12 +325,40 @@ class BlueprintGenerator:
                 "error": "OpenAI response was not valid JSON",
                 "violations": []
             }
+
+    def _cache_path(self, request_body: Dict[str, Any]) -> Path:
+        """Cache location for a generation, keyed on the full request (model, parameters and prompt)."""
+        key_source = orjson.dumps(request_body, option=orjson.OPT_SORT_KEYS)
+        return Path(BLUEPRINT_CACHE_DIR) / f"{hashlib.sha256(key_source).hexdigest()}.json"
+
+    def _read_cache(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached generation result, if caching is enabled and a fresh one exists."""
+        if not get_blueprint_cache_enabled():
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > BLUEPRINT_CACHE_TTL_SECONDS:
+                cache_file.unlink(missing_ok=True)
+                return None
+            return orjson.loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"OpenAI API call failed: {e}")
-            return False, {
-                "error": f"OpenAI API error: {str(e)}",
-                "violations": []
-            }
+            logger.warning(f"Ignoring unreadable blueprint cache entry {cache_file}: {e}")
+            return None
+
+    def _write_cache(self, cache_file: Path, result: Dict[str, Any]):
+        """Store a successful generation result for reuse, evicting the oldest entries past the cap."""
+        if not get_blueprint_cache_enabled():
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(orjson.dumps(result))
+
+            entries = sorted(cache_file.parent.glob("*.json"), key=lambda f: f.stat().st_mtime)
+            for stale in entries[:-BLUEPRINT_CACHE_MAX_ENTRIES]:
+                stale.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to write blueprint cache entry {cache_file}: {e}")
 
     def _generate_mock_blueprint(self, brief: str) -> Tuple[bool, Dict[str, Any]]:
         """Generate mock blueprint for testing/demo purposes."""
@@ -302,8 +524,8 @@ class BlueprintGenerator:
         try:
             # Read the blueprint schema
             schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'schema', 'blueprint.schema.json')
-            with open(schema_path, 'r') as f:
-                schema = json.load(f)
+            schema = orjson.loads(Path(schema_path).read_bytes())
+            # Indented stdlib output keeps the prompt human-readable
             return json.dumps(schema, indent=2)
         except Exception:
             return "Schema not available"
@@ -344,8 +566,8 @@ Return ONLY the JSON blueprint, no explanation or markdown formatting.
             if end != -1:
                 response_text = response_text[start:end].strip()
 
-        # Parse JSON
-        return json.loads(response_text.strip())
+        # Parse JSON (orjson.JSONDecodeError is a json.JSONDecodeError)
+        return orjson.loads(response_text.strip())
 
     def _attempt_auto_repair(self, blueprint: Dict[str, Any], violations: list) -> Optional[Dict[str, Any]]:
         """Attempt to auto-repair common blueprint issues."""
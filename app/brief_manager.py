@@ -6,7 +6,7 @@ import json
 import uuid
 import time
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -92,13 +92,15 @@ class BriefManager:
             logger.error(f"Failed to load brief {brief_id}: {e}")
             return None
     
-    def list_briefs(self, limit: int = 50) -> List[Brief]:
-        """List all briefs, most recent first."""
+    def list_briefs(self, limit: int = 50) -> Tuple[List[Brief], int]:
+        """List briefs, most recent first, along with the total number stored."""
         briefs = []
+        total = 0
         
         try:
             # Get all brief files
             brief_files = list(self.briefs_dir.glob("*.json"))
+            total = len(brief_files)
             
             # Sort by modification time (most recent first)
             brief_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -115,7 +117,7 @@ class BriefManager:
         except Exception as e:
             logger.error(f"Failed to list briefs: {e}")
         
-        return briefs
+        return briefs, total
     
     def create_job(self, brief_id: str) -> Optional[Job]:
         """Create a new job for a brief."""
@@ -170,9 +172,15 @@ class BriefManager:
             logger.error(f"Failed to update job {job.id}: {e}")
             return False
     
-    def list_jobs(self, brief_id: Optional[str] = None, limit: int = 50) -> List[Job]:
-        """List jobs, optionally filtered by brief ID."""
+    def list_jobs(self, brief_id: Optional[str] = None, limit: int = 50) -> Tuple[List[Job], int]:
+        """
+        List jobs, most recent first, optionally filtered by brief ID.
+
+        Returns:
+            Tuple of (jobs: up to `limit` matching jobs, total: number of matching jobs)
+        """
         jobs = []
+        total = 0
         
         try:
             # Get all job files
@@ -181,20 +189,25 @@ class BriefManager:
             # Sort by modification time (most recent first)
             job_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
             
-            # Load jobs up to limit
-            for job_file in job_files[:limit * 2]:  # Load extra in case we need to filter
+            if brief_id is None:
+                # Every file matches, so the total comes from the listing itself
+                total = len(job_files)
+                job_files = job_files[:limit]
+            
+            for job_file in job_files:
                 try:
                     with open(job_file, 'r') as f:
                         data = json.load(f)
-                    job = self._dict_to_job(data)
                     
                     # Filter by brief_id if specified
-                    if brief_id is None or job.brief_id == brief_id:
-                        jobs.append(job)
-                        
-                    # Stop if we have enough
-                    if len(jobs) >= limit:
-                        break
+                    if brief_id is not None:
+                        if data.get("brief_id") != brief_id:
+                            continue
+                        total += 1
+                    
+                    # Only build Job objects for the requested page
+                    if len(jobs) < limit:
+                        jobs.append(self._dict_to_job(data))
                         
                 except Exception as e:
                     logger.warning(f"Failed to load job from {job_file}: {e}")
@@ -202,7 +215,7 @@ class BriefManager:
         except Exception as e:
             logger.error(f"Failed to list jobs: {e}")
         
-        return jobs
+        return jobs, total
     
     def _job_to_dict(self, job: Job) -> Dict[str, Any]:
         """Convert Job object to dictionary for JSON serialization."""
@@ -14,11 +14,50 @@ MIN_LIMIT = 1
 MAX_LIMIT = 100
 DEFAULT_LIMIT = 50
 
+# HTTP Caching (seconds)
+SCHEMA_CACHE_MAX_AGE = 3600
+IMMUTABLE_CACHE_MAX_AGE = 86400
+
+# Lint Configuration
+MAX_SCHEMA_ERRORS = 50
+
 # Logging Configuration
 LOG_TRUNCATE_LENGTH = 2000
 
 # Webhook Configuration
 WEBHOOK_TIMEOUT_SECONDS = 10
+WEBHOOK_POOL_CONNECTIONS = 10
+WEBHOOK_POOL_MAXSIZE = 50
+WEBHOOK_MAX_RETRIES = 2
+WEBHOOK_RETRY_BACKOFF_FACTOR = 0.1
+WEBHOOK_ASYNC_MAX_CONNECTIONS = 50
+WEBHOOK_ASYNC_MAX_KEEPALIVE = 20
+WEBHOOK_MAX_RESPONSE_BYTES = 64 * 1024
+WEBHOOK_READ_CHUNK_BYTES = 8192
+
+# Export Pack Configuration
+EXPORT_PACK_STORED_MAX_BYTES = 100 * 1024  # Larger packs are deflated
+EXPORT_PACK_COMPRESS_LEVEL = 1
+
+# Test Harness Configuration
+MAX_RESULTS_PER_PAYLOAD = 1000
+
+# Blueprint Generation Configuration
+OPENAI_MODEL = "gpt-4"
+OPENAI_TEMPERATURE = 0.1
+OPENAI_MAX_TOKENS = 2000
+DEFAULT_LLM_TIMEOUT_SECONDS = 120.0  # fits a non-streaming OPENAI_MAX_TOKENS completion
+LLM_MAX_RETRIES = 2
+LLM_PREWARM_TIMEOUT_SECONDS = 5.0
+LLM_CONNECT_TIMEOUT_SECONDS = 5.0
+LLM_KEEPALIVE_CONNECTIONS = 32
+LLM_KEEPALIVE_EXPIRY_SECONDS = 60
+BLUEPRINT_CACHE_DIR = "data/blueprint_cache"
+BLUEPRINT_CACHE_TTL_SECONDS = 86400
+BLUEPRINT_CACHE_MAX_ENTRIES = 256
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 10
+BATCH_MAX_WAIT_SECONDS = 3600
 
 # Mock Blueprint Configuration
 MOCK_BLUEPRINT_VERSION = "v1.0"
@@ -35,6 +74,14 @@ def get_openai_api_key() -> str:
     """Get OpenAI API key from environment."""
     return os.getenv('OPENAI_API_KEY', '')
 
+def get_llm_timeout() -> float:
+    """Get per-request LLM timeout from environment or use default."""
+    return float(os.getenv('OTTOMATE_LLM_TIMEOUT', DEFAULT_LLM_TIMEOUT_SECONDS))
+
 def get_lim_api_key() -> str:
     """Get LIM API key from environment."""
-    return os.getenv('LIM_API_KEY', '')
\ No newline at end of file
+    return os.getenv('LIM_API_KEY', '')
+
+def get_blueprint_cache_enabled() -> bool:
+    """Whether generated blueprints may be served from the on-disk cache (off unless OTTOMATE_BLUEPRINT_CACHE=1)."""
+    return os.getenv('OTTOMATE_BLUEPRINT_CACHE', '') == '1'
@@ -5,23 +5,29 @@ Job Runner for asynchronous blueprint generation.
 import time
 import logging
 import threading
-from typing import Optional
+from typing import Dict, List, Optional
 
-from app.brief_manager import brief_manager, Job, JobStatus
-from app.blueprint_generator import blueprint_generator
+from app.brief_manager import brief_manager, BriefManager, Job, JobStatus
+from app.blueprint_generator import blueprint_generator, BlueprintGenerator
 
 logger = logging.getLogger(__name__)
 
 class JobRunner:
     """Runs blueprint generation jobs asynchronously."""
     
-    def __init__(self):
+    def __init__(self, manager: Optional[BriefManager] = None, generator: Optional[BlueprintGenerator] = None):
+        # Storage and generator default to the global instances
+        self.brief_manager = manager or brief_manager
+        self.blueprint_generator = generator or blueprint_generator
         self.running_jobs = {}  # job_id -> thread
+        # job_id -> [event, waiter count], only while someone waits
+        self._completion_events: Dict[str, List] = {}
+        self._events_lock = threading.Lock()
         
     def start_job(self, job_id: str) -> bool:
         """Start a blueprint generation job."""
         # Get the job
-        job = brief_manager.get_job(job_id)
+        job = self.brief_manager.get_job(job_id)
         if not job:
             logger.error(f"Job {job_id} not found")
             return False
@@ -32,12 +38,12 @@ class JobRunner:
             return False
         
         # Check if job is in correct state
-        if job.status != JobStatus.PENDING:
+        if job.status is not JobStatus.PENDING:
             logger.warning(f"Job {job_id} is not in pending state (current: {job.status.value})")
             return False
         
         # Get the brief
-        brief = brief_manager.get_brief(job.brief_id)
+        brief = self.brief_manager.get_brief(job.brief_id)
         if not brief:
             logger.error(f"Brief {job.brief_id} not found for job {job_id}")
             self._fail_job(job, "Brief not found")
@@ -62,12 +68,12 @@ class JobRunner:
             # Update job status to running
             job.status = JobStatus.RUNNING
             job.started_at = time.time()
-            brief_manager.update_job(job)
+            self.brief_manager.update_job(job)
             
             logger.info(f"Running job {job.id}")
             
             # Generate blueprint
-            success, result = blueprint_generator.generate_blueprint(brief_content)
+            success, result = self.blueprint_generator.generate_blueprint(brief_content)
             
             if success:
                 # Job completed successfully
@@ -90,7 +96,7 @@ class JobRunner:
                 logger.error(f"Job {job.id} failed: {job.error}")
             
             # Update job in storage
-            brief_manager.update_job(job)
+            self.brief_manager.update_job(job)
             
         except Exception as e:
             logger.error(f"Exception in job {job.id}: {e}")
@@ -100,6 +106,7 @@ class JobRunner:
             # Remove from running jobs
             if job.id in self.running_jobs:
                 del self.running_jobs[job.id]
+            self._notify_done(job.id)
     
     def _fail_job(self, job: Job, error_message: str):
         """Mark a job as failed."""
@@ -109,16 +116,57 @@ class JobRunner:
         job.result = {
             "failed_at": job.completed_at
         }
-        brief_manager.update_job(job)
+        self.brief_manager.update_job(job)
         
         # Remove from running jobs if present
         if job.id in self.running_jobs:
             del self.running_jobs[job.id]
+        self._notify_done(job.id)
+    
+    def wait_for_completion(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a job reaches a terminal state, without polling.
+
+        Returns:
+            True if the job is completed or failed, False on timeout
+        """
+        with self._events_lock:
+            entry = self._completion_events.setdefault(job_id, [threading.Event(), 0])
+            entry[1] += 1
+        event = entry[0]
+        
+        try:
+            # The job may already have finished before we registered; terminal state is stored before notifying.
+            # A job file caught mid-write reads as None, so only a terminal status short-circuits the wait.
+            job = self.brief_manager.get_job(job_id)
+            if job is not None and (job.status is JobStatus.COMPLETED or job.status is JobStatus.FAILED):
+                return True
+            
+            return event.wait(timeout)
+        finally:
+            # The last waiter drops the entry (unless _notify_done already did)
+            with self._events_lock:
+                if self._completion_events.get(job_id) is entry:
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del self._completion_events[job_id]
+    
+    def _notify_done(self, job_id: str):
+        """Wake anyone waiting on a job that has reached a terminal state."""
+        with self._events_lock:
+            entry = self._completion_events.pop(job_id, None)
+        if entry is not None:
+            entry[0].set()
     
     def get_running_jobs(self) -> list:
         """Get list of currently running job IDs."""
         return list(self.running_jobs.keys())
     
+    def get_waiting_jobs(self) -> list:
+        """Get list of job IDs that currently have someone in wait_for_completion."""
+        with self._events_lock:
+            return list(self._completion_events.keys())
+    
     def is_job_running(self, job_id: str) -> bool:
         """Check if a job is currently running."""
         return job_id in self.running_jobs
@@ -0,0 +1,24 @@
+"""
+orjson-backed JSON provider for the OttoMate Flask apps.
+Installed via `app.json = ORJSONProvider(app)` so jsonify and request.get_json use orjson.
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+class ORJSONProvider(JSONProvider):
+    """Serialize and parse JSON with orjson instead of the stdlib json module."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=_OPTIONS), mimetype="application/json")
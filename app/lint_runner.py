@@ -1,16 +1,22 @@
 import json
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any, List
 from jsonschema import Draft202012Validator
+from app.config import MAX_SCHEMA_ERRORS
 from app.lint_rules_make import ALL_MAKE_RULES
 
 SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schema" / "blueprint.schema.json"
+SCHEMA_OBJ = json.loads(SCHEMA_PATH.read_text())
+_VALIDATOR = Draft202012Validator(SCHEMA_OBJ)
 
 def validate_schema(bp: Dict[str, Any]) -> List[Dict[str, str]]:
-    schema = json.loads(SCHEMA_PATH.read_text())
-    validator = Draft202012Validator(schema)
     out = []
-    for e in validator.iter_errors(bp):
+    # Pull one past the cap so we only report truncation when errors were actually dropped
+    for e in islice(_VALIDATOR.iter_errors(bp), MAX_SCHEMA_ERRORS + 1):
+        if len(out) == MAX_SCHEMA_ERRORS:
+            out.append({"path": "$", "message": f"... (truncated at {MAX_SCHEMA_ERRORS} errors)", "rule": "SCHEMA"})
+            break
         path = ".".join(map(str, e.path)) or "$"
         out.append({"path": path, "message": e.message, "rule": "SCHEMA"})
     return out
@@ -0,0 +1,71 @@
+"""
+Typed response envelopes for OttoMate API.
+Fixed-shape endpoints encode these structs directly instead of going through jsonify.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import msgspec
+from flask import Response
+
+class OkResponse(msgspec.Struct, kw_only=True):
+    """Base envelope shared by all successful responses."""
+    ok: bool = True
+
+class BriefData(msgspec.Struct):
+    """Serialized brief."""
+    id: str
+    content: str
+    created_at: float
+    metadata: Dict[str, Any]
+
+class BriefResponse(OkResponse, kw_only=True):
+    """Response for a single brief."""
+    brief: BriefData
+
+class BriefListResponse(OkResponse, kw_only=True):
+    """Response for a page of briefs."""
+    briefs: List[BriefData]
+    count: int
+    total: int
+
+class JobCreatedData(msgspec.Struct):
+    """Serialized job as returned when it is first queued."""
+    id: str
+    brief_id: str
+    status: str
+    created_at: float
+
+class JobCreatedResponse(OkResponse, kw_only=True):
+    """Response for a newly queued job."""
+    job: JobCreatedData
+
+class JobSummaryData(msgspec.Struct):
+    """Serialized job in list views (no result payload).
+
+    error is only present for failed jobs, where it is sent even when null.
+    """
+    id: str
+    brief_id: str
+    status: str
+    created_at: float
+    started_at: Optional[float]
+    completed_at: Optional[float]
+    has_result: bool
+    error: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+class JobListResponse(OkResponse, kw_only=True):
+    """Response for a page of jobs."""
+    jobs: List[JobSummaryData]
+    count: int
+    total: int
+
+_ENCODER = msgspec.json.Encoder()
+
+def encode_response(payload: msgspec.Struct, status_code: int = 200) -> Response:
+    """Encode a response struct to a JSON Flask response."""
+    return Response(_ENCODER.encode(payload), status=status_code, mimetype="application/json")
+
+def brief_data(brief) -> BriefData:
+    """Build the serialized form of a Brief."""
+    return BriefData(id=brief.id, content=brief.content, created_at=brief.created_at, metadata=brief.metadata)
@@ -1,19 +1,34 @@
 import os
 import time
+import asyncio
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 import json
 import logging
-from flask import Flask, request, jsonify, send_from_directory, send_file
+from typing import Any, Dict, Tuple
+import orjson
+import msgspec
+from flask import Flask, Response, request, jsonify, send_from_directory, send_file
 from app.logging_config import setup_logging, log_api_request
-from app.config import MIN_LIMIT, MAX_LIMIT, DEFAULT_LIMIT, DEFAULT_HOST, get_port
+from app.config import (
+    MIN_LIMIT, MAX_LIMIT, DEFAULT_LIMIT, DEFAULT_HOST, get_port,
+    SCHEMA_CACHE_MAX_AGE, IMMUTABLE_CACHE_MAX_AGE
+)
 from app.error_handler import api_error, not_found_error, server_error, bad_request_error, validation_error
 from app.lint_runner import lint
 from app.blueprint_generator import blueprint_generator
 from app.guardrails import guardrails
-from app.brief_manager import brief_manager
+from app.brief_manager import brief_manager, JobStatus
 from app.job_runner import job_runner
+from app.json_provider import ORJSONProvider
+from app.responses import (
+    OkResponse, BriefResponse, BriefListResponse, JobCreatedData, JobCreatedResponse,
+    JobSummaryData, JobListResponse, encode_response, brief_data
+)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Setup logging
 logger = setup_logging()
@@ -39,9 +54,33 @@ def after_request(response):
 
     return response
 
+def immutable_response(etag: str, build_response, max_age: int = IMMUTABLE_CACHE_MAX_AGE) -> Response:
+    """
+    Serve a resource that never changes once written.
+
+    Answers 304 without building the body when the client's If-None-Match
+    already holds `etag`; otherwise calls `build_response()`.
+    """
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = build_response()
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"public, max-age={max_age}, immutable"
+    return response
+
+@lru_cache(maxsize=1)
+def _schema_payload() -> Tuple[bytes, str]:
+    """Load and encode the Blueprint JSON Schema once per process, with its ETag."""
+    # Load the schema from the root directory
+    schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'blueprint-schema.json')
+    with open(schema_path, 'rb') as f:
+        schema_bytes = orjson.dumps(orjson.loads(f.read()))
+    return schema_bytes, hashlib.sha256(schema_bytes).hexdigest()[:16]
+
 @app.get("/health")
 def health():
-    return jsonify({"ok": True})
+    return encode_response(OkResponse())
 
 @app.get("/")
 def index():
@@ -60,11 +99,12 @@ def static_files(filename):
 def schema():
     """Serve the Blueprint JSON Schema"""
     try:
-        # Load the schema from the root directory
-        schema_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'blueprint-schema.json')
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-        return jsonify(schema)
+        schema_bytes, etag = _schema_payload()
+        return immutable_response(
+            etag,
+            lambda: Response(schema_bytes, mimetype="application/json"),
+            max_age=SCHEMA_CACHE_MAX_AGE
+        )
     except FileNotFoundError:
         return not_found_error("Blueprint schema")
     except json.JSONDecodeError:
@@ -151,15 +191,7 @@ def create_brief():
     
     try:
         brief = brief_manager.create_brief(content, metadata)
-        return jsonify({
-            "ok": True,
-            "brief": {
-                "id": brief.id,
-                "content": brief.content,
-                "created_at": brief.created_at,
-                "metadata": brief.metadata
-            }
-        }), 201
+        return encode_response(BriefResponse(brief=brief_data(brief)), 201)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
@@ -170,20 +202,12 @@ def list_briefs():
         limit = request.args.get('limit', DEFAULT_LIMIT, type=int)
         limit = min(max(MIN_LIMIT, limit), MAX_LIMIT)  # Clamp between min and max
         
-        briefs = brief_manager.list_briefs(limit)
-        return jsonify({
-            "ok": True,
-            "briefs": [
-                {
-                    "id": brief.id,
-                    "content": brief.content,
-                    "created_at": brief.created_at,
-                    "metadata": brief.metadata
-                }
-                for brief in briefs
-            ],
-            "count": len(briefs)
-        })
+        briefs, total = brief_manager.list_briefs(limit)
+        return encode_response(BriefListResponse(
+            briefs=[brief_data(brief) for brief in briefs],
+            count=len(briefs),
+            total=total
+        ))
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
@@ -195,15 +219,11 @@ def get_brief(brief_id):
         if not brief:
             return jsonify({"ok": False, "error": "Brief not found"}), 404
         
-        return jsonify({
-            "ok": True,
-            "brief": {
-                "id": brief.id,
-                "content": brief.content,
-                "created_at": brief.created_at,
-                "metadata": brief.metadata
-            }
-        })
+        # Briefs are never modified after creation
+        return immutable_response(
+            f"{brief.id}-{brief.created_at}",
+            lambda: encode_response(BriefResponse(brief=brief_data(brief)))
+        )
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
@@ -232,15 +252,12 @@ def generate_from_brief(brief_id):
         if not job_runner.start_job(job.id):
             return jsonify({"ok": False, "error": "Failed to start job"}), 500
         
-        return jsonify({
-            "ok": True,
-            "job": {
-                "id": job.id,
-                "brief_id": job.brief_id,
-                "status": job.status.value,
-                "created_at": job.created_at
-            }
-        }), 202  # Accepted
+        return encode_response(JobCreatedResponse(job=JobCreatedData(
+            id=job.id,
+            brief_id=job.brief_id,
+            status=job.status.value,
+            created_at=job.created_at
+        )), 202)  # Accepted
         
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
@@ -253,31 +270,39 @@ def get_job(job_id):
         if not job:
             return jsonify({"ok": False, "error": "Job not found"}), 404
         
-        job_data = {
-            "id": job.id,
-            "brief_id": job.brief_id,
-            "status": job.status.value,
-            "created_at": job.created_at,
-            "started_at": job.started_at,
-            "completed_at": job.completed_at
-        }
-        
-        # Add result or error based on status
-        if job.status.value == "completed" and job.result:
-            job_data["result"] = job.result
-        elif job.status.value == "failed":
-            job_data["error"] = job.error
-            if job.result:
-                job_data["details"] = job.result
+        # Finished jobs are immutable; pending/running ones must not be cached
+        if job.status is JobStatus.COMPLETED or job.status is JobStatus.FAILED:
+            return immutable_response(f"{job.id}-{job.completed_at}", lambda: _job_response(job))
         
-        return jsonify({
-            "ok": True,
-            "job": job_data
-        })
+        return _job_response(job)
         
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
+def _job_response(job) -> Response:
+    """Build the full job response, including result or error details."""
+    job_data = {
+        "id": job.id,
+        "brief_id": job.brief_id,
+        "status": job.status.value,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at
+    }
+    
+    # Add result or error based on status
+    if job.status is JobStatus.COMPLETED and job.result:
+        job_data["result"] = job.result
+    elif job.status is JobStatus.FAILED:
+        job_data["error"] = job.error
+        if job.result:
+            job_data["details"] = job.result
+    
+    return jsonify({
+        "ok": True,
+        "job": job_data
+    })
+
 @app.get("/jobs")
 def list_jobs():
     """List all jobs."""
@@ -287,35 +312,28 @@ def list_jobs():
         
         brief_id = request.args.get('brief_id')  # Optional filter
         
-        jobs = brief_manager.list_jobs(brief_id=brief_id, limit=limit)
-        
-        jobs_data = []
-        for job in jobs:
-            job_data = {
-                "id": job.id,
-                "brief_id": job.brief_id,
-                "status": job.status.value,
-                "created_at": job.created_at,
-                "started_at": job.started_at,
-                "completed_at": job.completed_at
-            }
-            
-            # Add summary result info
-            if job.status.value == "completed" and job.result:
-                job_data["has_result"] = True
-            elif job.status.value == "failed":
-                job_data["error"] = job.error
-                job_data["has_result"] = False
-            else:
-                job_data["has_result"] = False
-            
-            jobs_data.append(job_data)
-        
-        return jsonify({
-            "ok": True,
-            "jobs": jobs_data,
-            "count": len(jobs_data)
-        })
+        jobs, total = brief_manager.list_jobs(brief_id=brief_id, limit=limit)
+        
+        jobs_data = [
+            JobSummaryData(
+                id=job.id,
+                brief_id=job.brief_id,
+                status=job.status.value,
+                created_at=job.created_at,
+                started_at=job.started_at,
+                completed_at=job.completed_at,
+                # Add summary result info
+                has_result=job.status is JobStatus.COMPLETED and bool(job.result),
+                error=job.error if job.status is JobStatus.FAILED else msgspec.UNSET
+            )
+            for job in jobs
+        ]
+        
+        return encode_response(JobListResponse(
+            jobs=jobs_data,
+            count=len(jobs_data),
+            total=total
+        ))
         
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
@@ -337,7 +355,7 @@ def export_job(job_id):
             return jsonify({"ok": False, "error": "Job not found"}), 404
         
         # Check if job is completed
-        if job.status.value != "completed":
+        if job.status is not JobStatus.COMPLETED:
             return jsonify({
                 "ok": False, 
                 "error": f"Job must be completed to export (current status: {job.status.value})"
@@ -412,6 +430,17 @@ def download_file(filename):
 from app.test_harness import test_harness
 from app.blueprint_diff import blueprint_diff
 
+def _test_result_summary(result) -> Dict[str, Any]:
+    """Serialize a test result as returned when a test is run."""
+    return {
+        "id": result.id,
+        "payload_id": result.payload_id,
+        "status": result.status.value,
+        "execution_time": result.execution_time,
+        "webhook_url": result.webhook_url,
+        "created_at": result.created_at
+    }
+
 @app.post("/test/payloads")
 def create_test_payload():
     """Create a new test payload."""
@@ -440,6 +469,39 @@ def create_test_payload():
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
+@app.post("/test/payloads:batch")
+def create_test_payloads_batch():
+    """Create several test payloads in one request."""
+    try:
+        data = request.get_json(force=True, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"ok": False, "error": "Request body must be a JSON object"}), 400
+        
+        items = data.get("payloads")
+        if not isinstance(items, list) or not items:
+            return jsonify({"ok": False, "error": "payloads must be a non-empty list"}), 400
+        
+        # Validate everything up front so a bad item doesn't leave a partial batch behind
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get("name") or not item.get("data"):
+                return jsonify({"ok": False, "error": f"payloads[{index}]: Name and data are required"}), 400
+        
+        created = []
+        for item in items:
+            name = item["name"]
+            description = item.get("description", "")
+            payload_id = test_harness.add_payload(name, description, item["data"], item.get("expected_output"))
+            created.append({"id": payload_id, "name": name, "description": description})
+        
+        return jsonify({
+            "ok": True,
+            "payloads": created,
+            "count": len(created)
+        }), 201
+        
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)}), 500
+
 @app.get("/test/payloads")
 def list_test_payloads():
     """List all test payloads."""
@@ -479,14 +541,40 @@ def run_test(payload_id):
         
         return jsonify({
             "ok": True,
-            "test_result": {
-                "id": result.id,
-                "payload_id": result.payload_id,
-                "status": result.status.value,
-                "execution_time": result.execution_time,
-                "webhook_url": result.webhook_url,
-                "created_at": result.created_at
-            }
+            "test_result": _test_result_summary(result)
+        }), 201
+        
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e)}), 500
+
+@app.post("/test/payloads:run")
+def run_tests_batch():
+    """Run tests for several payloads in one request."""
+    try:
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({"ok": False, "error": "Request body must be a JSON object"}), 400
+        
+        payload_ids = data.get("ids")
+        webhook_url = data.get("webhook_url")
+        
+        if not isinstance(payload_ids, list) or not payload_ids or not all(isinstance(pid, str) for pid in payload_ids):
+            return jsonify({"ok": False, "error": "ids must be a non-empty list of strings"}), 400
+        if webhook_url is not None and not isinstance(webhook_url, str):
+            return jsonify({"ok": False, "error": "webhook_url must be a string"}), 400
+        
+        missing = [pid for pid in payload_ids if not test_harness.get_payload(pid)]
+        if missing:
+            return jsonify({"ok": False, "error": f"Payloads not found: {', '.join(map(str, missing))}"}), 404
+        
+        # Webhook calls for the whole batch run concurrently on one async client
+        result_ids = asyncio.run(test_harness.run_tests(payload_ids, webhook_url))
+        results = [test_harness.get_result(result_id) for result_id in result_ids]
+        
+        return jsonify({
+            "ok": True,
+            "test_results": [_test_result_summary(result) for result in results],
+            "count": len(results)
         }), 201
         
     except Exception as e:
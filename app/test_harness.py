@@ -5,17 +5,31 @@ Accepts sample payloads, simulates webhook calls, and records test results.
 
 import json
 import time
+import asyncio
 import logging
+import orjson
 from typing import Dict, Any, List, Tuple, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter, Retry
 except ImportError:
     requests = None
 
-from app.config import WEBHOOK_TIMEOUT_SECONDS
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from app.config import (
+    WEBHOOK_TIMEOUT_SECONDS, WEBHOOK_POOL_CONNECTIONS, WEBHOOK_POOL_MAXSIZE,
+    WEBHOOK_MAX_RETRIES, WEBHOOK_RETRY_BACKOFF_FACTOR,
+    WEBHOOK_ASYNC_MAX_CONNECTIONS, WEBHOOK_ASYNC_MAX_KEEPALIVE, WEBHOOK_MAX_RESPONSE_BYTES,
+    WEBHOOK_READ_CHUNK_BYTES, MAX_RESULTS_PER_PAYLOAD
+)
 from dataclasses import dataclass, asdict
 from enum import Enum
+from collections import deque
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -56,6 +70,41 @@ class TestHarness:
     def __init__(self):
         self.payloads: Dict[str, TestPayload] = {}
         self.results: Dict[str, TestResult] = {}
+        self._by_payload: Dict[str, deque] = {}  # payload_id -> most recent results, oldest first
+        self._session = self._create_session()
+        self._async_client = None  # created lazily inside the running event loop
+    
+    def _create_session(self):
+        """Create a pooled HTTP session so repeated webhook calls reuse connections."""
+        if requests is None:
+            return None
+        
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json"})
+        # Only failures to connect are retried: a webhook POST that got any response
+        # (including 5xx) is never replayed, since the receiver may have acted on it
+        adapter = HTTPAdapter(
+            pool_connections=WEBHOOK_POOL_CONNECTIONS,
+            pool_maxsize=WEBHOOK_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=WEBHOOK_MAX_RETRIES,
+                backoff_factor=WEBHOOK_RETRY_BACKOFF_FACTOR
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def close(self):
+        """Close the HTTP session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+    
+    async def aclose(self):
+        """Close the async HTTP client used by run_test_async."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
         
     def add_payload(self, name: str, description: str, data: Dict[str, Any], 
                    expected_output: Optional[Dict[str, Any]] = None) -> str:
@@ -85,15 +134,65 @@ class TestHarness:
     
     def run_test(self, payload_id: str, webhook_url: Optional[str] = None) -> str:
         """Run a test with the specified payload."""
+        payload, result = self._start_result(payload_id, webhook_url)
+        
+        start_ns = time.monotonic_ns()
+        try:
+            
+            if webhook_url:
+                # Simulate webhook call
+                outcome = self._simulate_webhook_call(webhook_url, payload.data)
+            else:
+                # Simulate local processing
+                outcome = self._simulate_local_processing(payload.data)
+            
+            self._finish_result(result, payload, outcome)
+                
+        except Exception as e:
+            self._error_result(result, e)
+        finally:
+            result.execution_time = (time.monotonic_ns() - start_ns) / 1e9
+        
+        return result.id
+    
+    async def run_test_async(self, payload_id: str, webhook_url: Optional[str] = None) -> str:
+        """Run a test without blocking the event loop; webhook calls go through httpx.AsyncClient."""
+        payload, result = self._start_result(payload_id, webhook_url)
+        
+        start_ns = time.monotonic_ns()
+        try:
+            
+            if webhook_url:
+                outcome = await self._simulate_webhook_call_async(webhook_url, payload.data)
+            else:
+                outcome = self._simulate_local_processing(payload.data)
+            
+            self._finish_result(result, payload, outcome)
+                
+        except Exception as e:
+            self._error_result(result, e)
+        finally:
+            result.execution_time = (time.monotonic_ns() - start_ns) / 1e9
+        
+        return result.id
+    
+    async def run_tests(self, payload_ids: List[str], webhook_url: Optional[str] = None) -> List[str]:
+        """Run several tests concurrently and return their result IDs in order."""
+        try:
+            return await asyncio.gather(*(self.run_test_async(pid, webhook_url) for pid in payload_ids))
+        finally:
+            # The async client is bound to this event loop; callers using asyncio.run get a fresh loop each time
+            await self.aclose()
+    
+    def _start_result(self, payload_id: str, webhook_url: Optional[str]) -> Tuple[TestPayload, TestResult]:
+        """Look up the payload and store a new running result for it."""
         payload = self.get_payload(payload_id)
         if not payload:
             raise ValueError(f"Payload {payload_id} not found")
         
-        result_id = str(uuid.uuid4())
-        
         # Create initial result
         result = TestResult(
-            id=result_id,
+            id=str(uuid.uuid4()),
             payload_id=payload_id,
             status=TestStatus.RUNNING,
             execution_time=0.0,
@@ -101,72 +200,79 @@ class TestHarness:
             created_at=time.time()
         )
         
-        self.results[result_id] = result
+        self._store_result(result)
+        return payload, result
+    
+    def _finish_result(self, result: TestResult, payload: TestPayload,
+                       outcome: Tuple[bool, Optional[Dict[str, Any]], Optional[str]]):
+        """Record a completed execution and decide pass/fail."""
+        success, response_data, error = outcome
         
-        try:
-            start_time = time.time()
-            
-            if webhook_url:
-                # Simulate webhook call
-                success, response_data, error = self._simulate_webhook_call(webhook_url, payload.data)
-            else:
-                # Simulate local processing
-                success, response_data, error = self._simulate_local_processing(payload.data)
-            
-            execution_time = time.time() - start_time
-            
-            # Update result
-            result.execution_time = execution_time
-            result.response_data = response_data
-            
-            if success:
-                # Check if output matches expected (if provided)
-                if payload.expected_output:
-                    if self._compare_outputs(response_data, payload.expected_output):
-                        result.status = TestStatus.PASSED
-                    else:
-                        result.status = TestStatus.FAILED
-                        result.error_message = "Output does not match expected result"
-                else:
+        # Update result
+        result.response_data = response_data
+        
+        if success:
+            # Check if output matches expected (if provided)
+            if payload.expected_output:
+                if self._compare_outputs(response_data, payload.expected_output):
                     result.status = TestStatus.PASSED
+                else:
+                    result.status = TestStatus.FAILED
+                    result.error_message = "Output does not match expected result"
             else:
-                result.status = TestStatus.FAILED
-                result.error_message = error
-                
-        except Exception as e:
-            result.status = TestStatus.ERROR
-            result.error_message = str(e)
-            result.execution_time = time.time() - start_time
-            logger.error(f"Test execution failed: {e}")
+                result.status = TestStatus.PASSED
+        else:
+            result.status = TestStatus.FAILED
+            result.error_message = error
+    
+    def _error_result(self, result: TestResult, exc: Exception):
+        """Record an execution that raised."""
+        result.status = TestStatus.ERROR
+        result.error_message = str(exc)
+        logger.error(f"Test execution failed: {exc}")
+    
+    def _store_result(self, result: TestResult):
+        """Store a result and index it by payload ID, evicting the oldest once a payload hits its cap."""
+        payload_results = self._by_payload.get(result.payload_id)
+        if payload_results is None:
+            payload_results = self._by_payload[result.payload_id] = deque(maxlen=MAX_RESULTS_PER_PAYLOAD)
+        elif len(payload_results) == payload_results.maxlen:
+            self.results.pop(payload_results[0].id, None)
         
-        self.results[result_id] = result
-        return result_id
+        payload_results.append(result)
+        self.results[result.id] = result
     
     def get_result(self, result_id: str) -> Optional[TestResult]:
         """Get a test result by ID."""
         return self.results.get(result_id)
     
     def list_results(self, payload_id: Optional[str] = None) -> List[TestResult]:
-        """List test results, optionally filtered by payload ID."""
-        results = list(self.results.values())
-        
+        """List test results, most recent first, optionally filtered by payload ID."""
+        # Results are stored in creation order, so newest-first is a reversed walk
         if payload_id:
-            results = [r for r in results if r.payload_id == payload_id]
+            return list(reversed(self._by_payload.get(payload_id, ())))
         
-        return sorted(results, key=lambda r: r.created_at, reverse=True)
+        return list(reversed(self.results.values()))
     
     def get_test_summary(self, payload_id: Optional[str] = None) -> Dict[str, Any]:
         """Get a summary of test results."""
         results = self.list_results(payload_id)
         
-        total = len(results)
-        passed = len([r for r in results if r.status == TestStatus.PASSED])
-        failed = len([r for r in results if r.status == TestStatus.FAILED])
-        errors = len([r for r in results if r.status == TestStatus.ERROR])
+        # Tally everything in a single pass over the results
+        total = passed = failed = errors = 0
+        total_time = 0.0
+        for r in results:
+            total += 1
+            total_time += r.execution_time
+            status = r.status
+            if status is TestStatus.PASSED:
+                passed += 1
+            elif status is TestStatus.FAILED:
+                failed += 1
+            elif status is TestStatus.ERROR:
+                errors += 1
         
-        avg_execution_time = 0.0
-        if results:
-            avg_execution_time = sum(r.execution_time for r in results) / len(results)
+        avg_execution_time = total_time / total if total else 0.0
         
         return {
             "total_tests": total,
@@ -182,31 +288,31 @@ class TestHarness:
         try:
             logger.info(f"Simulating webhook call to {webhook_url}")
             
-            # For demo purposes, we'll simulate different responses based on URL
-            if "test" in webhook_url.lower() or "mock" in webhook_url.lower():
-                # Simulate successful test webhook
-                return True, {
-                    "status": "success",
-                    "message": "Webhook received and processed",
-                    "received_data": payload_data,
-                    "timestamp": time.time()
-                }, None
+            mock_outcome = self._mock_webhook_response(webhook_url, payload_data)
+            if mock_outcome:
+                return mock_outcome
             else:
                 # Try actual HTTP call with timeout if requests is available
-                if requests is None:
+                if self._session is None:
                     return False, None, "requests library not available for webhook calls"
 
-                response = requests.post(
+                # Stream the body so an oversized response is never held in memory
+                with self._session.post(
                     webhook_url,
                     json=payload_data,
                     timeout=WEBHOOK_TIMEOUT_SECONDS,
-                    headers={"Content-Type": "application/json"}
-                )
+                    stream=True
+                ) as response:
+                    chunks = []
+                    total = 0
+                    for chunk in response.iter_content(WEBHOOK_READ_CHUNK_BYTES):
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if total > WEBHOOK_MAX_RESPONSE_BYTES:
+                            return False, None, "Webhook response too large"
+                    body = b"".join(chunks)
 
-                if response.status_code < 400:
-                    return True, response.json() if response.content else {"status": "success"}, None
-                else:
-                    return False, None, f"HTTP {response.status_code}: {response.text}"
+                return self._webhook_outcome(response.status_code, body)
                     
         except Exception as e:
             if requests and "Timeout" in str(e):
@@ -216,6 +322,67 @@ class TestHarness:
             else:
                 return False, None, f"Webhook call failed: {str(e)}"
     
+    async def _simulate_webhook_call_async(self, webhook_url: str, payload_data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Async counterpart of _simulate_webhook_call using a shared httpx.AsyncClient."""
+        try:
+            logger.info(f"Simulating webhook call to {webhook_url}")
+            
+            mock_outcome = self._mock_webhook_response(webhook_url, payload_data)
+            if mock_outcome:
+                return mock_outcome
+            
+            if httpx is None:
+                return False, None, "httpx library not available for async webhook calls"
+            
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=WEBHOOK_ASYNC_MAX_CONNECTIONS,
+                        max_keepalive_connections=WEBHOOK_ASYNC_MAX_KEEPALIVE
+                    ),
+                    timeout=WEBHOOK_TIMEOUT_SECONDS
+                )
+            
+            async with self._async_client.stream("POST", webhook_url, json=payload_data) as response:
+                chunks = []
+                total = 0
+                async for chunk in response.aiter_bytes(WEBHOOK_READ_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total > WEBHOOK_MAX_RESPONSE_BYTES:
+                        return False, None, "Webhook response too large"
+                body = b"".join(chunks)
+            
+            return self._webhook_outcome(response.status_code, body)
+                
+        except Exception as e:
+            if httpx and isinstance(e, httpx.TimeoutException):
+                return False, None, "Webhook call timed out"
+            elif httpx and isinstance(e, httpx.ConnectError):
+                return False, None, "Could not connect to webhook URL"
+            else:
+                return False, None, f"Webhook call failed: {str(e)}"
+    
+    def _webhook_outcome(self, status_code: int, body: bytes) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Turn a webhook status code and (size-capped) body into a call outcome."""
+        if status_code < 400:
+            return True, orjson.loads(body) if body else {"status": "success"}, None
+        else:
+            return False, None, f"HTTP {status_code}: {body.decode(errors='replace')}"
+    
+    def _mock_webhook_response(self, webhook_url: str, payload_data: Dict[str, Any]) -> Optional[Tuple[bool, Optional[Dict[str, Any]], Optional[str]]]:
+        """Return a simulated response for test/mock webhook URLs, or None for real ones."""
+        # For demo purposes, we'll simulate different responses based on URL
+        if "test" in webhook_url.lower() or "mock" in webhook_url.lower():
+            # Simulate successful test webhook
+            return True, {
+                "status": "success",
+                "message": "Webhook received and processed",
+                "received_data": payload_data,
+                "timestamp": time.time()
+            }, None
+        return None
+    
     def _simulate_local_processing(self, payload_data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """Simulate local processing of payload."""
         try:
@@ -244,16 +411,12 @@ class TestHarness:
     
     def _compare_outputs(self, actual: Dict[str, Any], expected: Dict[str, Any]) -> bool:
         """Compare actual output with expected output."""
-        try:
-            # Simple comparison - in production this could be more sophisticated
-            for key, expected_value in expected.items():
-                if key not in actual:
-                    return False
-                if actual[key] != expected_value:
-                    return False
-            return True
-        except Exception:
+        # Simple comparison - in production this could be more sophisticated
+        if not isinstance(actual, dict) or not isinstance(expected, dict):
             return False
+        
+        # Every expected key must be present with an equal value; the items-view subset test runs in C
+        return expected.items() <= actual.items()
 
 # Global instance
 test_harness = TestHarness()
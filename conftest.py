@@ -0,0 +1,15 @@
+"""
+Pytest configuration for OttoMate API.
+
+The suite runs serially by default. With pytest-xdist installed, test files can
+be spread across workers on demand:
+
+    python -m pytest -n auto --dist loadfile
+"""
+
+# Live-server workflow scripts: their steps are async and share one HTTP client,
+# so run them directly (`python test_day5_workflow.py`) against a running server.
+collect_ignore = [
+    "test_day5_workflow.py",
+    "test_day6_export.py",
+]
@@ -0,0 +1,45 @@
+"""
+On-disk lint result cache shared by the Golden Brief test scripts.
+"""
+
+import hashlib
+import inspect
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+
+from app import config, lint_runner, lint_rules_make
+from app.lint_runner import lint
+
+# Lint results for unchanged blueprints are reused across runs
+LINT_CACHE_DIR = Path(".pytest_cache") / "lint"
+
+@lru_cache(maxsize=1)
+def _lint_code_hash() -> str:
+    """Fingerprint the lint rules, their config and the schema so cached results are dropped when they change."""
+    digest = hashlib.sha256()
+    for module in (lint_runner, lint_rules_make, config):
+        digest.update(inspect.getsource(module).encode())
+    digest.update(lint_runner.SCHEMA_PATH.read_bytes())
+    return digest.hexdigest()
+
+def canonical_json(obj: Any) -> bytes:
+    """Compact, key-sorted JSON encoding used for cache keys and digests."""
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+def cached_lint(blueprint: Dict[str, Any]) -> Dict[str, Any]:
+    """Lint a blueprint, reusing an on-disk result for the same blueprint and lint code."""
+    key = hashlib.sha256(_lint_code_hash().encode() + canonical_json(blueprint)).hexdigest()
+    cache_file = LINT_CACHE_DIR / f"{key}.json"
+    
+    try:
+        return orjson.loads(cache_file.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        pass
+    
+    result = lint(blueprint)
+    LINT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(orjson.dumps(result))
+    return result
@@ -1,9 +1,15 @@
 from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
 import re
+import orjson
+
+_ID_RE = re.compile(r"[A-Za-z0-9_\-]{3,64}")
+_OUT_TYPES = frozenset({"http_response","datastore_write","email_send","webhook_reply"})
 
 def rule_unique_module_ids(bp: Dict[str, Any]) -> List[str]:
-    ids = [m.get("id") for m in bp.get("modules", [])]
-    dupes = sorted({x for x in ids if ids.count(x) > 1})
+    counts = Counter(m.get("id") for m in bp.get("modules", []))
+    dupes = sorted(i for i, c in counts.items() if c > 1 and i is not None)
     return [f"Duplicate module id: {d}" for d in dupes]
 
 def rule_no_orphan_connections(bp: Dict[str, Any]) -> List[str]:
@@ -39,31 +45,41 @@ def rule_config_is_object(bp: Dict[str, Any]) -> List[str]:
 def rule_id_format(bp: Dict[str, Any]) -> List[str]:
     errs=[]
     for m in bp.get("modules", []):
-        mid = m.get("id","")
-        if not re.fullmatch(r"[A-Za-z0-9_\-]{3,64}", mid or ""):
+        mid = m.get("id") or ""
+        if not _ID_RE.fullmatch(mid):
             errs.append(f"Module id invalid: {mid}")
     return errs
 
-def rule_no_cycles_trivial(bp: Dict[str, Any]) -> List[str]:
-    pairs=set((c.get("from"), c.get("to")) for c in bp.get("connections", []))
+def _cycle_errors(pairs: set) -> List[str]:
     errs=[]
+    seen_cycles=set()
     for f,t in pairs:
         if f==t:
             errs.append(f"Self-loop not allowed: {f}")
-        if (t,f) in pairs and f!=t:
-            errs.append(f"2-node cycle between {f} and {t}")
+            continue
+        if (t,f) in pairs:
+            # Report each 2-node cycle once, under a canonical (ordered) key
+            key = (f,t) if str(f) < str(t) else (t,f)
+            if key not in seen_cycles:
+                seen_cycles.add(key)
+                errs.append(f"2-node cycle between {key[0]} and {key[1]}")
     return errs
 
+def rule_no_cycles_trivial(bp: Dict[str, Any]) -> List[str]:
+    pairs=set((c.get("from"), c.get("to")) for c in bp.get("connections", []))
+    return _cycle_errors(pairs)
+
 def rule_entrypoint_exists(bp: Dict[str, Any]) -> List[str]:
     for m in bp.get("modules", []):
-        if m.get("type","").lower()=="trigger" or m.get("config",{}).get("trigger") is True:
+        t = (m.get("type") or "").lower()
+        if t=="trigger" or m.get("config",{}).get("trigger") is True:
             return []
     return ["No trigger/entrypoint module found"]
 
 def rule_output_exists(bp: Dict[str, Any]) -> List[str]:
-    outs={"http_response","datastore_write","email_send","webhook_reply"}
     for m in bp.get("modules", []):
-        if m.get("type","").lower() in outs:
+        t = m.get("type")
+        if t and t.lower() in _OUT_TYPES:
             return []
     return ["No obvious output/sink module found"]
 
@@ -79,3 +95,65 @@ ALL_RULES=[
     rule_entrypoint_exists,
     rule_output_exists,
 ]
+
+def fused_lint(bp: Dict[str, Any]) -> List[str]:
+    """Run every rule in ALL_RULES with a single pass over modules and one over connections.
+
+    Findings are returned in the same order as running ALL_RULES one after another.
+    """
+    modules = bp.get("modules", [])
+    connections = bp.get("connections", [])
+
+    counts = Counter()
+    type_errs, config_errs, id_errs = [], [], []
+    has_entry = has_output = False
+    for m in modules:
+        mid = m.get("id")
+        counts[mid] += 1
+        mtype = (m.get("type") or "").lower()
+        config = m.get("config")
+        if not mtype:
+            type_errs.append(f"Module {mid} missing type")
+        if not isinstance(config, dict):
+            config_errs.append(f"Module {mid} config must be object")
+        if not _ID_RE.fullmatch(mid or ""):
+            id_errs.append(f"Module id invalid: {mid or ''}")
+        if mtype=="trigger" or (isinstance(config, dict) and config.get("trigger") is True):
+            has_entry = True
+        if mtype in _OUT_TYPES:
+            has_output = True
+
+    orphan_errs = []
+    pairs = set()
+    for c in connections:
+        f, t = c.get("from"), c.get("to")
+        if f not in counts:
+            orphan_errs.append(f"Connection from unknown module: {f}")
+        if t not in counts:
+            orphan_errs.append(f"Connection to unknown module: {t}")
+        pairs.add((f, t))
+
+    dupes = sorted(i for i, c in counts.items() if c > 1 and i is not None)
+    errs = [f"Duplicate module id: {d}" for d in dupes]
+    errs.extend(orphan_errs)
+    if not bp.get("name"):
+        errs.append("Blueprint name missing")
+    if len(connections) < 1:
+        errs.append("At least one connection required")
+    errs.extend(type_errs)
+    errs.extend(config_errs)
+    errs.extend(id_errs)
+    errs.extend(_cycle_errors(pairs))
+    if not has_entry:
+        errs.append("No trigger/entrypoint module found")
+    if not has_output:
+        errs.append("No obvious output/sink module found")
+    return errs
+
+@lru_cache(maxsize=256)
+def _fused_lint_cached(bp_json: bytes) -> tuple:
+    return tuple(fused_lint(orjson.loads(bp_json)))
+
+def fused_lint_cached(bp: Dict[str, Any]) -> List[str]:
+    """fused_lint memoized on the blueprint's canonical JSON, for batch linting of repeated blueprints."""
+    return list(_fused_lint_cached(orjson.dumps(bp, option=orjson.OPT_SORT_KEYS)))
@@ -1,9 +1,12 @@
-import os, json, logging
+import os, logging
+import orjson
 from flask import Flask, request, jsonify
-from app.config import get_port, get_lim_api_key, LOG_TRUNCATE_LENGTH, DEFAULT_HOST
+from app.config import get_lim_api_key, LOG_TRUNCATE_LENGTH
+from app.json_provider import ORJSONProvider
 from app.logging_config import setup_logging
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 logger = setup_logging()
 
 @app.get("/")
@@ -30,7 +33,7 @@ def echo():
     body = request.get_json(silent=True)
     if body is None:
         return jsonify(ok=False, error="Invalid JSON"), 400
-    app.logger.info("echo payload=%s", json.dumps(body)[:LOG_TRUNCATE_LENGTH])
+    app.logger.info("echo payload=%s", orjson.dumps(body).decode()[:LOG_TRUNCATE_LENGTH])
     return jsonify(ok=True, received=body)
 
 # --- readiness that depends on env ---
@@ -47,6 +50,3 @@ def bad_request(e):
 @app.errorhandler(404)
 def not_found(e):
     return jsonify(ok=False, error="not_found"), 404
-
-if __name__ == "__main__":
-    app.run(host=DEFAULT_HOST, port=get_port())
@@ -3,30 +3,28 @@
 Test script for Day 5 Brief → Generate → Status workflow.
 """
 
+import asyncio
 import json
 import time
-import requests
+import httpx
+import orjson
 import sys
 from typing import Dict, Any, Optional
 
 # Base URL for the API
 BASE_URL = "http://localhost:8080"
 
-def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
+async def make_request(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
     """Make HTTP request to the API."""
-    url = f"{BASE_URL}{endpoint}"
-    
     try:
-        if method.upper() == "GET":
-            response = requests.get(url)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data)
-        else:
+        if method.upper() not in ("GET", "POST"):
             raise ValueError(f"Unsupported method: {method}")
         
+        response = await client.request(method.upper(), endpoint, json=data)
+        
         return {
             "status_code": response.status_code,
-            "data": response.json() if response.content else {},
+            "data": orjson.loads(response.content) if response.content else {},
             "success": response.status_code < 400
         }
     except Exception as e:
@@ -36,11 +34,11 @@ def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = No
             "success": False
         }
 
-def test_health_check():
+async def test_health_check(client: httpx.AsyncClient):
     """Test the health endpoint."""
     print("🏥 Testing Health Check...")
     
-    result = make_request("GET", "/health")
+    result = await make_request(client, "GET", "/health")
     
     if result["success"] and result["data"].get("ok"):
         print("   ✅ Health check passed")
@@ -49,7 +47,7 @@ def test_health_check():
         print(f"   ❌ Health check failed: {result}")
         return False
 
-def test_create_brief():
+async def test_create_brief(client: httpx.AsyncClient):
     """Test creating a brief."""
     print("\n📝 Testing Brief Creation...")
     
@@ -61,7 +59,7 @@ def test_create_brief():
         }
     }
     
-    result = make_request("POST", "/briefs", brief_data)
+    result = await make_request(client, "POST", "/briefs", brief_data)
     
     if result["success"] and result["data"].get("ok"):
         brief = result["data"]["brief"]
@@ -73,11 +71,11 @@ def test_create_brief():
         print(f"   ❌ Brief creation failed: {result}")
         return None
 
-def test_get_brief(brief_id: str):
+async def test_get_brief(client: httpx.AsyncClient, brief_id: str):
     """Test retrieving a brief."""
     print(f"\n🔍 Testing Brief Retrieval (ID: {brief_id[:8]}...)...")
     
-    result = make_request("GET", f"/briefs/{brief_id}")
+    result = await make_request(client, "GET", f"/briefs/{brief_id}")
     
     if result["success"] and result["data"].get("ok"):
         brief = result["data"]["brief"]
@@ -88,11 +86,11 @@ def test_get_brief(brief_id: str):
         print(f"   ❌ Brief retrieval failed: {result}")
         return False
 
-def test_list_briefs():
+async def test_list_briefs(client: httpx.AsyncClient):
     """Test listing briefs."""
     print("\n📋 Testing Brief Listing...")
     
-    result = make_request("GET", "/briefs?limit=10")
+    result = await make_request(client, "GET", "/briefs?limit=10")
     
     if result["success"] and result["data"].get("ok"):
         briefs = result["data"]["briefs"]
@@ -104,11 +102,11 @@ def test_list_briefs():
         print(f"   ❌ Brief listing failed: {result}")
         return False
 
-def test_generate_from_brief(brief_id: str):
+async def test_generate_from_brief(client: httpx.AsyncClient, brief_id: str):
     """Test generating a blueprint from a brief."""
     print(f"\n🚀 Testing Blueprint Generation (Brief ID: {brief_id[:8]}...)...")
     
-    result = make_request("POST", f"/briefs/{brief_id}:generate")
+    result = await make_request(client, "POST", f"/briefs/{brief_id}:generate")
     
     if result["success"] and result["data"].get("ok"):
         job = result["data"]["job"]
@@ -121,7 +119,7 @@ def test_generate_from_brief(brief_id: str):
         print(f"   📄 Response: {result['data']}")
         return None
 
-def main():
+async def main():
     """Run the complete Day 5 workflow test."""
     print("🧪 Day 5 Brief → Generate → Status Workflow Test")
     print("=" * 60)
@@ -129,30 +127,35 @@ def main():
     # Test results
     results = []
     
-    # 1. Health check
-    results.append(("Health Check", test_health_check()))
-    
-    if not results[-1][1]:
-        print("\n❌ Server not responding. Make sure the API server is running.")
-        return 1
-    
-    # 2. Create brief
-    brief_id = test_create_brief()
-    results.append(("Create Brief", brief_id is not None))
-    
-    if not brief_id:
-        print("\n❌ Cannot continue without a brief.")
-        return 1
-    
-    # 3. Get brief
-    results.append(("Get Brief", test_get_brief(brief_id)))
-    
-    # 4. List briefs
-    results.append(("List Briefs", test_list_briefs()))
-    
-    # 5. Generate from brief
-    job_id = test_generate_from_brief(brief_id)
-    results.append(("Generate from Brief", job_id is not None))
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        # 1. Health check
+        results.append(("Health Check", await test_health_check(client)))
+        
+        if not results[-1][1]:
+            print("\n❌ Server not responding. Make sure the API server is running.")
+            return 1
+        
+        # 2. Create brief
+        brief_id = await test_create_brief(client)
+        results.append(("Create Brief", brief_id is not None))
+        
+        if not brief_id:
+            print("\n❌ Cannot continue without a brief.")
+            return 1
+        
+        # 3-5. Get brief, list briefs and generate only depend on the brief, so run them concurrently
+        got_brief, listed_briefs, job_id = await asyncio.gather(
+            test_get_brief(client, brief_id),
+            test_list_briefs(client),
+            test_generate_from_brief(client, brief_id)
+        )
+        results.append(("Get Brief", got_brief))
+        results.append(("List Briefs", listed_briefs))
+        results.append(("Generate from Brief", job_id is not None))
     
     # Summary
     print("\n" + "=" * 60)
@@ -189,4 +192,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
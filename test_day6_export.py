@@ -3,30 +3,28 @@
 Test script for Day 6 Export Pack functionality.
 """
 
+import asyncio
 import json
 import time
-import requests
+import httpx
+import orjson
 import sys
 from typing import Dict, Any, Optional
 
 # Base URL for the API
 BASE_URL = "http://localhost:8080"
 
-def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
+async def make_request(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
     """Make HTTP request to the API."""
-    url = f"{BASE_URL}{endpoint}"
-    
     try:
-        if method.upper() == "GET":
-            response = requests.get(url)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data)
-        else:
+        if method.upper() not in ("GET", "POST"):
             raise ValueError(f"Unsupported method: {method}")
         
+        response = await client.request(method.upper(), endpoint, json=data)
+        
         return {
             "status_code": response.status_code,
-            "data": response.json() if response.content else {},
+            "data": orjson.loads(response.content) if response.content else {},
             "success": response.status_code < 400
         }
     except Exception as e:
@@ -36,7 +34,24 @@ def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = No
             "success": False
         }
 
-def test_export_pack():
+def check_zip_contents(zip_source) -> bool:
+    """Check that an export pack (path or file object) holds all required files."""
+    import zipfile
+    with zipfile.ZipFile(zip_source, 'r') as zipf:
+        files = zipf.namelist()
+    print(f"   📁 ZIP contents: {', '.join(files)}")
+    
+    expected_files = ["blueprint.json", "proposal.md", "runbook.md", "validation_report.md"]
+    missing_files = [f for f in expected_files if f not in files]
+    
+    if missing_files:
+        print(f"❌ Missing files: {missing_files}")
+        return False
+    
+    print("✅ All required files present in ZIP")
+    return True
+
+async def test_export_pack(client: httpx.AsyncClient):
     """Test the complete export pack workflow."""
     print("🧪 Day 6 Export Pack Test")
     print("=" * 50)
@@ -48,7 +63,7 @@ def test_export_pack():
         "metadata": {"test": True, "export_test": True}
     }
     
-    result = make_request("POST", "/briefs", brief_data)
+    result = await make_request(client, "POST", "/briefs", brief_data)
     if not result["success"]:
         print(f"❌ Failed to create brief: {result}")
         return False
@@ -60,7 +75,7 @@ def test_export_pack():
     print("\n🔧 Step 2: Creating mock completed job...")
     
     # First create the job
-    result = make_request("POST", f"/briefs/{brief_id}:generate")
+    result = await make_request(client, "POST", f"/briefs/{brief_id}:generate")
     if not result["success"]:
         print(f"❌ Failed to create job: {result}")
         return False
@@ -106,49 +121,55 @@ def test_export_pack():
         print(f"   📄 Proposal: {len(proposal)} characters")
         print(f"   📖 Runbook: {len(runbook)} characters")
         
-        # Test export pack generation
-        success, result_path = export_pack_generator.generate_export_pack(
-            mock_blueprint, brief_data["content"], job_id
+        # Test in-memory export pack generation
+        success, pack = export_pack_generator.build_export_pack(
+            mock_blueprint, brief_data["content"]
         )
         
-        if success:
-            print(f"✅ Export pack generated: {result_path}")
+        if not success:
+            print(f"❌ Export pack generation failed: {pack}")
+            return False
+        
+        print("✅ Export pack generated")
+        print(f"   📦 ZIP size: {len(pack)} bytes")
+        
+        # Test ZIP contents
+        import io
+        if not check_zip_contents(io.BytesIO(pack)):
+            return False
+        
+        # Test the file-writing path used by the export endpoint
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as export_dir:
+            success, result_path = export_pack_generator.generate_export_pack(
+                mock_blueprint, brief_data["content"], job_id, export_dir=export_dir
+            )
             
-            # Check if file exists
-            import os
-            if os.path.exists(result_path):
-                file_size = os.path.getsize(result_path)
-                print(f"   📦 ZIP file size: {file_size} bytes")
-                
-                # Test ZIP contents
-                import zipfile
-                with zipfile.ZipFile(result_path, 'r') as zipf:
-                    files = zipf.namelist()
-                    print(f"   📁 ZIP contents: {', '.join(files)}")
-                    
-                    expected_files = ["blueprint.json", "proposal.md", "runbook.md", "validation_report.md"]
-                    missing_files = [f for f in expected_files if f not in files]
-                    
-                    if not missing_files:
-                        print("✅ All required files present in ZIP")
-                        return True
-                    else:
-                        print(f"❌ Missing files: {missing_files}")
-                        return False
-            else:
+            if not success:
+                print(f"❌ Export pack file generation failed: {result_path}")
+                return False
+            
+            if not os.path.exists(result_path):
                 print(f"❌ ZIP file not found at {result_path}")
                 return False
-        else:
-            print(f"❌ Export pack generation failed: {result_path}")
-            return False
+            
+            print(f"✅ Export pack written: {os.path.basename(result_path)}")
+            print(f"   📦 ZIP file size: {os.path.getsize(result_path)} bytes")
+            return check_zip_contents(result_path)
             
     except Exception as e:
         print(f"❌ Export test failed: {e}")
         return False
 
-def main():
+async def main():
     """Run the Day 6 export test."""
-    success = test_export_pack()
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        success = await test_export_pack(client)
     
     print("\n" + "=" * 50)
     print("📊 Day 6 Test Results:")
@@ -167,4 +188,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
@@ -4,30 +4,31 @@ Test script for Day 7 Test Harness functionality.
 Tests with GB-1 to verify at least 1 passing test.
 """
 
+import asyncio
 import json
 import time
-import requests
+import httpx
+import orjson
 import sys
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Dict, Any, Optional
 
 # Base URL for the API
 BASE_URL = "http://localhost:8080"
 
-def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
+async def make_request(client: httpx.AsyncClient, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None ) -> Dict[str, Any]:
     """Make HTTP request to the API."""
-    url = f"{BASE_URL}{endpoint}"
-    
     try:
-        if method.upper() == "GET":
-            response = requests.get(url)
-        elif method.upper() == "POST":
-            response = requests.post(url, json=data)
-        else:
+        if method.upper() not in ("GET", "POST"):
             raise ValueError(f"Unsupported method: {method}")
         
+        response = await client.request(method.upper(), endpoint, json=data)
+        
         return {
             "status_code": response.status_code,
-            "data": response.json() if response.content else {},
+            "data": orjson.loads(response.content) if response.content else {},
             "success": response.status_code < 400
         }
     except Exception as e:
@@ -37,14 +38,17 @@ def make_request(method: str, endpoint: str, data: Optional[Dict[str, Any]] = No
             "success": False
         }
 
-def test_day7_harness():
+async def run_day7_harness(client: httpx.AsyncClient):
     """Test the complete Day 7 test harness functionality."""
     print("🧪 Day 7 Test Harness Test")
     print("=" * 50)
     
-    # Step 1: Create test payloads
+    # Step 1-2: Create test payloads
     print("\n📝 Step 1: Creating test payloads...")
     
+    # One timestamp labels both payloads
+    now_ns = time.time_ns()
+    
     # GB-1 style payload (Gmail urgent email)
     gb1_payload = {
         "name": "GB-1 Gmail Urgent Email",
@@ -55,7 +59,7 @@ def test_day7_harness():
                 "from": "alerts@company.com",
                 "body": "The production server is experiencing issues.",
                 "labels": ["URGENT", "INBOX"],
-                "timestamp": time.time()
+                "timestamp": now_ns
             }
         },
         "expected_output": {
@@ -64,15 +68,7 @@ def test_day7_harness():
         }
     }
     
-    result = make_request("POST", "/test/payloads", gb1_payload)
-    if not result["success"]:
-        print(f"❌ Failed to create GB-1 payload: {result}")
-        return False
-    
-    gb1_payload_id = result["data"]["payload"]["id"]
-    print(f"✅ GB-1 payload created: {gb1_payload_id[:8]}...")
-    
-    # Step 2: Create additional test payload
+    # Additional test payload
     slack_payload = {
         "name": "Slack Message Test",
         "description": "Test payload for Slack message processing",
@@ -81,22 +77,24 @@ def test_day7_harness():
                 "text": "Hello from test harness!",
                 "channel": "#general",
                 "user": "testbot",
-                "timestamp": time.time()
+                "timestamp": now_ns
             }
         }
     }
     
-    result = make_request("POST", "/test/payloads", slack_payload)
+    # Create both payloads in a single batch request
+    result = await make_request(client, "POST", "/test/payloads:batch", {"payloads": [gb1_payload, slack_payload]})
     if not result["success"]:
-        print(f"❌ Failed to create Slack payload: {result}")
+        print(f"❌ Failed to create test payloads: {result}")
         return False
     
-    slack_payload_id = result["data"]["payload"]["id"]
+    gb1_payload_id, slack_payload_id = (payload["id"] for payload in result["data"]["payloads"])
+    print(f"✅ GB-1 payload created: {gb1_payload_id[:8]}...")
     print(f"✅ Slack payload created: {slack_payload_id[:8]}...")
     
     # Step 3: List payloads
     print("\n📋 Step 3: Listing test payloads...")
-    result = make_request("GET", "/test/payloads")
+    result = await make_request(client, "GET", "/test/payloads")
     if result["success"]:
         payloads = result["data"]["payloads"]
         print(f"✅ Found {len(payloads)} test payloads")
@@ -108,35 +106,37 @@ def test_day7_harness():
     
     # Step 4: Run tests
     print("\n🚀 Step 4: Running tests...")
+    print("   Testing GB-1 payload and Slack payload with mock webhook...")
+    webhook_data = {"webhook_url": "https://hooks.slack.com/test/mock/webhook"}
+    gb1_run, slack_run = await asyncio.gather(
+        make_request(client, "POST", f"/test/payloads/{gb1_payload_id}:run"),
+        make_request(client, "POST", f"/test/payloads/{slack_payload_id}:run", webhook_data)
+    )
     
-    # Run GB-1 test
-    print("   Testing GB-1 payload...")
-    result = make_request("POST", f"/test/payloads/{gb1_payload_id}:run")
-    if not result["success"]:
-        print(f"❌ Failed to run GB-1 test: {result}")
+    if not gb1_run["success"]:
+        print(f"❌ Failed to run GB-1 test: {gb1_run}")
         return False
     
-    gb1_result_id = result["data"]["test_result"]["id"]
-    gb1_status = result["data"]["test_result"]["status"]
+    gb1_result_id = gb1_run["data"]["test_result"]["id"]
+    gb1_status = gb1_run["data"]["test_result"]["status"]
     print(f"✅ GB-1 test executed: {gb1_status}")
     
-    # Run Slack test with mock webhook
-    print("   Testing Slack payload with mock webhook...")
-    webhook_data = {"webhook_url": "https://hooks.slack.com/test/mock/webhook"}
-    result = make_request("POST", f"/test/payloads/{slack_payload_id}:run", webhook_data )
-    if not result["success"]:
-        print(f"❌ Failed to run Slack test: {result}")
+    if not slack_run["success"]:
+        print(f"❌ Failed to run Slack test: {slack_run}")
         return False
     
-    slack_result_id = result["data"]["test_result"]["id"]
-    slack_status = result["data"]["test_result"]["status"]
+    slack_status = slack_run["data"]["test_result"]["status"]
     print(f"✅ Slack test executed: {slack_status}")
     
     # Step 5: Check test results
     print("\n📊 Step 5: Checking test results...")
     
-    # Get GB-1 result details
-    result = make_request("GET", f"/test/results/{gb1_result_id}")
+    # GB-1 result details and the summary are independent reads
+    result, summary_result = await asyncio.gather(
+        make_request(client, "GET", f"/test/results/{gb1_result_id}"),
+        make_request(client, "GET", "/test/summary")
+    )
+    
     if result["success"]:
         gb1_result = result["data"]["result"]
         print(f"✅ GB-1 result: {gb1_result['status']} ({gb1_result['execution_time']:.3f}s)")
@@ -146,10 +146,8 @@ def test_day7_harness():
         print(f"❌ Failed to get GB-1 result: {result}")
         return False
     
-    # Get test summary
-    result = make_request("GET", "/test/summary")
-    if result["success"]:
-        summary = result["data"]["summary"]
+    if summary_result["success"]:
+        summary = summary_result["data"]["summary"]
         print(f"✅ Test summary:")
         print(f"   Total tests: {summary['total_tests']}")
         print(f"   Passed: {summary['passed']}")
@@ -162,7 +160,7 @@ def test_day7_harness():
         
         return has_passing_test and gb1_passed
     else:
-        print(f"❌ Failed to get test summary: {result}")
+        print(f"❌ Failed to get test summary: {summary_result}")
         return False
 
 def test_validation_report_with_tests():
@@ -220,13 +218,213 @@ def test_validation_report_with_tests():
         print(f"❌ Validation report test failed: {e}")
         return False
 
-def main():
+@contextmanager
+def local_webhook_server(handler_class):
+    """Serve handler_class on a free localhost port for the duration of the block; yields the webhook URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/hook"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_webhook_post_not_replayed_on_server_error():
+    """A webhook POST answered with 503 is sent exactly once and reported as failed."""
+    from app.test_harness import test_harness
+
+    received = []
+
+    class UnavailableHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    with local_webhook_server(UnavailableHandler) as webhook_url:
+        success, _, error = test_harness._simulate_webhook_call(webhook_url, {"event": "ping"})
+
+    assert not success
+    assert "503" in error
+    assert len(received) == 1
+
+def test_oversized_webhook_response_is_rejected(monkeypatch):
+    """A webhook response larger than WEBHOOK_MAX_RESPONSE_BYTES fails the call instead of being buffered."""
+    import app.test_harness as harness_module
+    from app.test_harness import test_harness
+
+    monkeypatch.setattr(harness_module, "WEBHOOK_MAX_RESPONSE_BYTES", 1024)
+    monkeypatch.setattr(harness_module, "WEBHOOK_READ_CHUNK_BYTES", 256)
+
+    class LargeResponseHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'{"padding": "' + b"x" * 4096 + b'"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    with local_webhook_server(LargeResponseHandler) as webhook_url:
+        success, response_data, error = test_harness._simulate_webhook_call(webhook_url, {"event": "ping"})
+
+    assert not success
+    assert response_data is None
+    assert error == "Webhook response too large"
+
+def test_results_evicted_past_per_payload_cap(monkeypatch):
+    """Once a payload has MAX_RESULTS_PER_PAYLOAD results, the oldest is dropped from results and list_results."""
+    import app.test_harness as harness_module
+    from app.test_harness import test_harness
+
+    monkeypatch.setattr(harness_module, "MAX_RESULTS_PER_PAYLOAD", 3)
+    payload_id = test_harness.add_payload("Eviction", "", {"message": "Hello"})
+    result_ids = [test_harness.run_test(payload_id) for _ in range(5)]
+
+    assert [test_harness.get_result(rid) for rid in result_ids[:2]] == [None, None]
+    assert all(test_harness.get_result(rid) for rid in result_ids[2:])
+    assert [r.id for r in test_harness.list_results(payload_id)] == result_ids[:1:-1]
+    assert not {r.id for r in test_harness.list_results()} & set(result_ids[:2])
+
+def test_non_object_expected_output_fails_test():
+    """A non-object expected_output is recorded as a failed comparison, not an error."""
+    from app.test_harness import test_harness, TestStatus
+
+    payload_id = test_harness.add_payload("List expectation", "", {"message": "Hello"}, ["message_processed"])
+    result = test_harness.get_result(test_harness.run_test(payload_id))
+
+    assert result.status is TestStatus.FAILED
+
+def test_run_tests_calls_webhook_concurrently():
+    """run_tests posts every payload to the webhook concurrently and records each response."""
+    from app.test_harness import test_harness, TestStatus
+
+    # Each request waits for the other, so a sequential run would break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class EchoHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            barrier.wait()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    payload_ids = [
+        test_harness.add_payload("Async one", "", {"n": 1}, {"n": 1}),
+        test_harness.add_payload("Async two", "", {"n": 2}, {"n": 2}),
+    ]
+    with local_webhook_server(EchoHandler) as webhook_url:
+        result_ids = asyncio.run(test_harness.run_tests(payload_ids, webhook_url))
+
+    results = [test_harness.get_result(rid) for rid in result_ids]
+    assert [r.payload_id for r in results] == payload_ids
+    assert [r.status for r in results] == [TestStatus.PASSED, TestStatus.PASSED]
+    assert [r.response_data for r in results] == [{"n": 1}, {"n": 2}]
+
+def test_batch_endpoints_reject_malformed_bodies():
+    """The batch payload endpoints answer malformed input with 400, not 500."""
+    from app.server import app
+
+    client = app.test_client()
+    cases = [
+        ("/test/payloads:batch", [{"name": "x", "data": {"a": 1}}]),
+        ("/test/payloads:batch", "not json"),
+        ("/test/payloads:run", ["some-id"]),
+        ("/test/payloads:run", {"ids": [["x"]]}),
+        ("/test/payloads:run", {"ids": [1]}),
+        ("/test/payloads:run", {"ids": ["some-id"], "webhook_url": 5}),
+    ]
+    for endpoint, body in cases:
+        if isinstance(body, str):
+            response = client.post(endpoint, data=body, content_type="application/json")
+        else:
+            response = client.post(endpoint, json=body)
+        assert response.status_code == 400, (endpoint, body, response.get_json())
+        assert response.get_json()["ok"] is False
+
+def test_batch_endpoints_create_and_run():
+    """Payloads created through /test/payloads:batch can be run through /test/payloads:run."""
+    from app.server import app
+
+    client = app.test_client()
+    created = client.post("/test/payloads:batch", json={"payloads": [
+        {"name": "Batch email", "data": {"email": {"subject": "Hi"}}},
+        {"name": "Batch message", "data": {"message": "Hello"}},
+    ]})
+    assert created.status_code == 201
+    ids = [payload["id"] for payload in created.get_json()["payloads"]]
+
+    run = client.post("/test/payloads:run", json={"ids": ids})
+    assert run.status_code == 201
+    assert run.get_json()["count"] == 2
+
+    missing = client.post("/test/payloads:run", json={"ids": ["no-such-payload"]})
+    assert missing.status_code == 404
+
+def test_batch_run_endpoint_calls_webhook_concurrently():
+    """/test/payloads:run sends the batch's webhook calls concurrently and reports each result."""
+    from app.server import app
+
+    received = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    class AckHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append(orjson.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+            barrier.wait()
+            body = b'{"received": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    client = app.test_client()
+    created = client.post("/test/payloads:batch", json={"payloads": [
+        {"name": "Webhook one", "data": {"n": 1}},
+        {"name": "Webhook two", "data": {"n": 2}},
+    ]})
+    ids = [payload["id"] for payload in created.get_json()["payloads"]]
+
+    with local_webhook_server(AckHandler) as webhook_url:
+        run = client.post("/test/payloads:run", json={"ids": ids, "webhook_url": webhook_url})
+
+    assert run.status_code == 201
+    results = run.get_json()["test_results"]
+    assert [r["payload_id"] for r in results] == ids
+    assert [r["status"] for r in results] == ["passed", "passed"]
+    assert sorted(item["n"] for item in received) == [1, 2]
+
+async def main():
     """Run the complete Day 7 test."""
     print("🧪 Day 7 Test Harness Complete Test")
     print("=" * 60)
     
-    # Test API endpoints
-    api_success = test_day7_harness()
+    # Test API endpoints over one shared, pooled client
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        api_success = await run_day7_harness(client)
     
     # Test validation report integration
     report_success = test_validation_report_with_tests()
@@ -259,4 +457,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
@@ -4,15 +4,55 @@ Day 8 Test: Blueprint Diff functionality for OttoMate API.
 Tests the blueprint comparison and diff functionality.
 """
 
-import json
 import sys
 import os
 
+import orjson
+import pytest
+
 # Add the current directory to Python path so we can import app modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.blueprint_diff import blueprint_diff, ChangeType
 
+def clone(blueprint):
+    """Deep-copy a JSON-only blueprint (faster than copy.deepcopy)."""
+    return orjson.loads(orjson.dumps(blueprint))
+
+@pytest.fixture(scope="module")
+def empty_blueprint():
+    """v1.0 blueprint with no modules. Shared across tests, so clone before mutating."""
+    return {
+        "version": "v1.0",
+        "triggerId": "gmail-trigger",
+        "modules": [],
+        "connections": []
+    }
+
+@pytest.fixture(scope="module")
+def gmail_blueprint():
+    """v1.0 blueprint with a single Gmail trigger. Shared across tests, so clone before mutating."""
+    return {
+        "version": "v1.0",
+        "triggerId": "gmail-trigger",
+        "modules": [
+            {
+                "id": "gmail-trigger",
+                "type": "trigger",
+                "name": "Gmail New Email",
+                "params": {}
+            }
+        ],
+        "connections": []
+    }
+
+SLACK_ACTION = {
+    "id": "slack-action",
+    "type": "action",
+    "name": "Send Slack Message",
+    "params": {}
+}
+
 def test_identical_blueprints():
     """Test that identical blueprints return no differences."""
     blueprint = {
@@ -38,21 +78,11 @@ def test_identical_blueprints():
     assert diff_result.total_changes == 0
     assert len(diff_result.changes) == 0
 
-def test_version_change():
+def test_version_change(empty_blueprint):
     """Test detection of version changes."""
-    blueprint1 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
-
-    blueprint2 = {
-        "version": "v2.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
+    blueprint1 = empty_blueprint
+    blueprint2 = clone(empty_blueprint)
+    blueprint2["version"] = "v2.0"
 
     diff_result = blueprint_diff.compare_blueprints(blueprint1, blueprint2)
 
@@ -63,43 +93,13 @@ def test_version_change():
     assert diff_result.changes[0].old_value == "v1.0"
     assert diff_result.changes[0].new_value == "v2.0"
 
-def test_module_addition():
+def test_module_addition(gmail_blueprint):
     """Test detection of module additions."""
-    blueprint1 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [
-            {
-                "id": "gmail-trigger",
-                "type": "trigger",
-                "name": "Gmail New Email",
-                "params": {}
-            }
-        ],
-        "connections": []
-    }
-
-    blueprint2 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [
-            {
-                "id": "gmail-trigger",
-                "type": "trigger",
-                "name": "Gmail New Email",
-                "params": {}
-            },
-            {
-                "id": "slack-action",
-                "type": "action",
-                "name": "Send Slack Message",
-                "params": {
-                    "channel": "#alerts"
-                }
-            }
-        ],
-        "connections": []
-    }
+    blueprint1 = gmail_blueprint
+    blueprint2 = clone(gmail_blueprint)
+    slack_action = clone(SLACK_ACTION)
+    slack_action["params"]["channel"] = "#alerts"
+    blueprint2["modules"].append(slack_action)
 
     diff_result = blueprint_diff.compare_blueprints(blueprint1, blueprint2)
 
@@ -107,45 +107,15 @@ def test_module_addition():
     assert diff_result.summary["added"] == 1
 
     # Find the module addition change
-    module_changes = [c for c in diff_result.changes if c.path == "modules.slack-action"]
+    module_changes = diff_result.changes_by_path.get("modules.slack-action", [])
     assert len(module_changes) == 1
     assert module_changes[0].change_type == ChangeType.ADDED
 
-def test_module_removal():
+def test_module_removal(gmail_blueprint):
     """Test detection of module removal."""
-    blueprint1 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [
-            {
-                "id": "gmail-trigger",
-                "type": "trigger",
-                "name": "Gmail New Email",
-                "params": {}
-            },
-            {
-                "id": "slack-action",
-                "type": "action",
-                "name": "Send Slack Message",
-                "params": {}
-            }
-        ],
-        "connections": []
-    }
-
-    blueprint2 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [
-            {
-                "id": "gmail-trigger",
-                "type": "trigger",
-                "name": "Gmail New Email",
-                "params": {}
-            }
-        ],
-        "connections": []
-    }
+    blueprint1 = clone(gmail_blueprint)
+    blueprint1["modules"].append(clone(SLACK_ACTION))
+    blueprint2 = gmail_blueprint
 
     diff_result = blueprint_diff.compare_blueprints(blueprint1, blueprint2)
 
@@ -153,7 +123,7 @@ def test_module_removal():
     assert diff_result.summary["removed"] == 1
 
     # Find the module removal change
-    module_changes = [c for c in diff_result.changes if c.path == "modules.slack-action"]
+    module_changes = diff_result.changes_by_path.get("modules.slack-action", [])
     assert len(module_changes) == 1
     assert module_changes[0].change_type == ChangeType.REMOVED
 
@@ -237,24 +207,14 @@ def test_connection_changes():
     assert diff_result.is_identical == False
 
     # Check for connection addition
-    connection_changes = [c for c in diff_result.changes if "connections" in c.path]
+    connection_changes = diff_result.changes_by_prefix.get("connections", [])
     assert any(c.change_type == ChangeType.ADDED for c in connection_changes)
 
-def test_human_readable_format():
+def test_human_readable_format(empty_blueprint):
     """Test human-readable diff formatting."""
-    blueprint1 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
-
-    blueprint2 = {
-        "version": "v2.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
+    blueprint1 = empty_blueprint
+    blueprint2 = clone(empty_blueprint)
+    blueprint2["version"] = "v2.0"
 
     diff_result = blueprint_diff.compare_blueprints(blueprint1, blueprint2)
     human_readable = blueprint_diff.format_diff_human_readable(diff_result)
@@ -264,21 +224,11 @@ def test_human_readable_format():
     assert "Modified: 1" in human_readable
     assert "Changed version from 'v1.0' to 'v2.0'" in human_readable
 
-def test_json_format():
+def test_json_format(empty_blueprint):
     """Test JSON diff formatting."""
-    blueprint1 = {
-        "version": "v1.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
-
-    blueprint2 = {
-        "version": "v2.0",
-        "triggerId": "gmail-trigger",
-        "modules": [],
-        "connections": []
-    }
+    blueprint1 = empty_blueprint
+    blueprint2 = clone(empty_blueprint)
+    blueprint2["version"] = "v2.0"
 
     diff_result = blueprint_diff.compare_blueprints(blueprint1, blueprint2)
     json_diff = blueprint_diff.format_diff_json(diff_result)
@@ -363,40 +313,3 @@ def test_complex_blueprint_diff():
     assert diff_result.summary["added"] > 0
     assert diff_result.summary["removed"] > 0
     assert diff_result.summary["modified"] > 0
-
-if __name__ == "__main__":
-    print("Running Day 8 Blueprint Diff Tests...")
-
-    # Run each test function
-    test_functions = [
-        test_identical_blueprints,
-        test_version_change,
-        test_module_addition,
-        test_module_removal,
-        test_parameter_changes,
-        test_connection_changes,
-        test_human_readable_format,
-        test_json_format,
-        test_complex_blueprint_diff
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_func in test_functions:
-        try:
-            print(f"  Running {test_func.__name__}...")
-            test_func()
-            print(f"    ✓ PASSED")
-            passed += 1
-        except Exception as e:
-            print(f"    ✗ FAILED: {e}")
-            failed += 1
-
-    print(f"\nTest Results: {passed} passed, {failed} failed")
-
-    if failed == 0:
-        print("🎉 All Day 8 Blueprint Diff tests passed!")
-    else:
-        print("❌ Some tests failed.")
-        exit(1)
\ No newline at end of file
@@ -3,36 +3,49 @@
 Test script to validate Golden Briefs against schema and lint rules.
 """
 
-import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from app.lint_runner import lint
+from typing import Any, Dict, Optional, Tuple
+import orjson
+from lint_cache import cached_lint
 
-def test_golden_brief(filepath):
-    """Test a single Golden Brief file."""
-    print(f"\n🧪 Testing: {filepath}")
-    
+def test_golden_brief(filepath) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Lint a single Golden Brief file.
+
+    Runs in a worker process, so it returns its outcome instead of printing.
+
+    Returns:
+        Tuple of (filepath, lint result or None, error or None)
+    """
     try:
-        with open(filepath, 'r') as f:
-            blueprint = json.load(f)
+        blueprint = orjson.loads(Path(filepath).read_bytes())
         
         # Run lint validation
-        result = lint(blueprint)
-        
-        print(f"✅ Loaded successfully")
-        print(f"📊 Lint result: {'PASS' if result['ok'] else 'FAIL'}")
-        print(f"🔍 Violations: {result['count']}")
-        
-        if result['violations']:
-            print("📝 Issues found:")
-            for violation in result['violations']:
-                print(f"   - {violation['rule']}: {violation['message']} (path: {violation['path']})")
-        
-        return result['ok']
+        return filepath, cached_lint(blueprint), None
         
     except Exception as e:
-        print(f"❌ Error: {e}")
+        return filepath, None, str(e)
+
+def report_golden_brief(filepath, result: Optional[Dict[str, Any]], error: Optional[str]) -> bool:
+    """Print the outcome of a single Golden Brief check."""
+    print(f"\n🧪 Testing: {filepath}")
+    
+    if error is not None:
+        print(f"❌ Error: {error}")
         return False
+    
+    print(f"✅ Loaded successfully")
+    print(f"📊 Lint result: {'PASS' if result['ok'] else 'FAIL'}")
+    print(f"🔍 Violations: {result['count']}")
+    
+    if result['violations']:
+        print("📝 Issues found:")
+        for violation in result['violations']:
+            print(f"   - {violation['rule']}: {violation['message']} (path: {violation['path']})")
+    
+    return result['ok']
 
 def main():
     """Run tests on all Golden Brief files."""
@@ -46,10 +59,19 @@ def main():
         "tests/fixtures/gb-make-compliant.json"
     ]
     
+    existing_files = [filepath for filepath in test_files if Path(filepath).exists()]
+    
+    # Each file is linted independently, so spread the CPU-bound work across processes
+    outcomes = {}
+    if existing_files:
+        with ProcessPoolExecutor(max_workers=len(existing_files)) as executor:
+            for filepath, result, error in executor.map(test_golden_brief, existing_files):
+                outcomes[filepath] = (result, error)
+    
     results = []
     for filepath in test_files:
-        if Path(filepath).exists():
-            results.append(test_golden_brief(filepath))
+        if filepath in outcomes:
+            results.append(report_golden_brief(filepath, *outcomes[filepath]))
         else:
             print(f"\n⚠️  File not found: {filepath}")
             results.append(False)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for JobRunner.wait_for_completion.
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+# Add the current directory to Python path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.brief_manager import BriefManager, JobStatus
+from app.job_runner import JobRunner
+
+class GatedGenerator:
+    """Blueprint generator that only returns once `release` is set."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def generate_blueprint(self, brief):
+        self.release.wait(5)
+        return True, {"blueprint": {"version": "v1.0", "triggerId": "t", "modules": [], "connections": []}}
+
+@pytest.fixture
+def manager(tmp_path):
+    """Brief/job storage isolated in a temporary directory."""
+    return BriefManager(storage_dir=str(tmp_path))
+
+@pytest.fixture
+def generator():
+    generator = GatedGenerator()
+    yield generator
+    generator.release.set()
+
+def start_job(runner, manager):
+    """Create a brief and job and start it; returns the job ID."""
+    brief = manager.create_brief("Wait for completion test brief")
+    job = manager.create_job(brief.id)
+    assert runner.start_job(job.id)
+    return job.id
+
+def test_wait_for_already_completed_job(manager, generator):
+    """A job finished before anyone waits returns immediately and leaves no waiter behind."""
+    runner = JobRunner(manager, generator)
+    generator.release.set()
+    job_id = start_job(runner, manager)
+    assert runner.wait_for_completion(job_id, timeout=5)
+
+    # Already terminal: returns without waiting on the (never set) new event
+    assert runner.wait_for_completion(job_id, timeout=0)
+    assert manager.get_job(job_id).status is JobStatus.COMPLETED
+    assert runner.get_waiting_jobs() == []
+
+def test_wait_for_job_completing_later(manager, generator):
+    """A waiter is woken when the job finishes."""
+    runner = JobRunner(manager, generator)
+    job_id = start_job(runner, manager)
+    threading.Timer(0.05, generator.release.set).start()
+
+    assert runner.wait_for_completion(job_id, timeout=5)
+    assert manager.get_job(job_id).status is JobStatus.COMPLETED
+    assert runner.get_waiting_jobs() == []
+
+def test_wait_for_completion_timeout(manager, generator):
+    """A job that doesn't finish in time times out and leaves no waiter behind."""
+    runner = JobRunner(manager, generator)
+    job_id = start_job(runner, manager)
+
+    assert not runner.wait_for_completion(job_id, timeout=0.05)
+    assert runner.get_waiting_jobs() == []
+
+def test_concurrent_waiters_share_one_event(manager, generator):
+    """A waiter timing out doesn't strand another waiter on the same job."""
+    runner = JobRunner(manager, generator)
+    job_id = start_job(runner, manager)
+    results = []
+    long_waiter = threading.Thread(target=lambda: results.append(runner.wait_for_completion(job_id, timeout=5)))
+    long_waiter.start()
+
+    assert not runner.wait_for_completion(job_id, timeout=0.05)
+    generator.release.set()
+    long_waiter.join()
+
+    assert results == [True]
+    assert runner.get_waiting_jobs() == []
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the standalone blueprint lint rules in lints.py.
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path so we can import lints
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lints import ALL_RULES, fused_lint, fused_lint_cached, rule_no_cycles_trivial
+
+def run_all_rules(bp):
+    failures = []
+    for rule in ALL_RULES:
+        failures.extend(rule(bp))
+    return failures
+
+def test_fused_lint_clean_blueprint():
+    """A well-formed blueprint produces no findings."""
+    blueprint = {
+        "name": "Urgent email alerts",
+        "modules": [
+            {"id": "gmail-trigger", "type": "trigger", "config": {}},
+            {"id": "slack-reply", "type": "webhook_reply", "config": {}}
+        ],
+        "connections": [{"from": "gmail-trigger", "to": "slack-reply"}]
+    }
+
+    assert fused_lint(blueprint) == []
+    assert run_all_rules(blueprint) == []
+
+def test_fused_lint_matches_all_rules():
+    """fused_lint reports the same findings, in the same order, as ALL_RULES."""
+    blueprint = {
+        "modules": [
+            {"id": "aa", "type": "trigger", "config": {}},
+            {"id": "aa", "config": []},
+            {"id": "node-b", "type": "action", "config": {}},
+            {"type": "action", "config": {}}
+        ],
+        "connections": [
+            {"from": "aa", "to": "node-b"},
+            {"from": "node-b", "to": "aa"},
+            {"from": "node-b", "to": "node-b"},
+            {"from": "ghost", "to": "aa"}
+        ]
+    }
+
+    assert fused_lint(blueprint) == run_all_rules(blueprint)
+    assert "Duplicate module id: aa" in fused_lint(blueprint)
+
+def test_fused_lint_empty_blueprint():
+    """An empty blueprint reports every structural rule."""
+    assert fused_lint({}) == run_all_rules({})
+
+def test_fused_lint_cached_matches_fused_lint():
+    """The memoized wrapper returns fresh lists with the same findings."""
+    blueprint = {"name": "x", "modules": [{"id": "ab", "type": "trigger", "config": {}}], "connections": []}
+
+    first = fused_lint_cached(blueprint)
+    first.append("mutated")
+
+    assert fused_lint_cached(blueprint) == fused_lint(blueprint)
+
+def test_two_node_cycle_reported_once():
+    """A 2-node cycle is reported once, with its endpoints in sorted order."""
+    blueprint = {"connections": [{"from": "node-b", "to": "node-a"}, {"from": "node-a", "to": "node-b"}]}
+
+    assert rule_no_cycles_trivial(blueprint) == ["2-node cycle between node-a and node-b"]